@@ -4,14 +4,31 @@ import subprocess
 import os
 import sys
 import threading
+from collections import deque
 from pathlib import Path
+from concurrent.futures import Future
+import queue
 import json
+import math
 import re
-import urllib.request
-import urllib.parse
-import time
-from typing import Optional, List
+import secrets
+import shutil
+import tempfile
+from typing import (
+    Optional,
+    List,
+    Dict,
+    Callable,
+    Iterator,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
 from dataclasses import dataclass
+from functools import lru_cache
+
+if TYPE_CHECKING:
+    import http.client
 
 # Ensure FFmpeg and FFprobe work from bundled folder
 if getattr(sys, "frozen", False):
@@ -29,24 +46,55 @@ os.environ["PATH"] = ffmpeg_dir + os.pathsep + os.environ["PATH"]
 
 # UI Configuration
 WINDOW_MIN_WIDTH = 700
-WINDOW_START_Y_PERCENT = 33  # Start window at 33% from top of screen
 
 # File Configuration
 SUPPORTED_VIDEO_FORMATS = [".mp4", ".webm", ".mkv", ".avi", ".mov", ".wmv", ".flv"]
+VIDEO_EXTENSIONS = tuple(SUPPORTED_VIDEO_FORMATS)  # For str.endswith
+SUPPORTED_VIDEO_EXTENSIONS = frozenset(SUPPORTED_VIDEO_FORMATS)  # For membership
+BROWSE_FILETYPES = [
+    ("Video files", " ".join(f"*{ext}" for ext in SUPPORTED_VIDEO_FORMATS)),
+    ("MP4 files", "*.mp4"),
+    ("All files", "*.*"),
+]
 MAX_FILE_SIZE_MB = 1024  # 1GB limit for uploads
+INVALID_FILENAME_CHARS_REGEX = re.compile(r'[<>:"/\\|?*]')
 
 # Time Configuration
 DEFAULT_START_TIME = "0:00"
 DEFAULT_END_TIME = "0:00"
 TIME_FORMAT_REGEX = r"^(\d{1,2}):(\d{2})(?::(\d{2}))?$"
+TIME_UPDATE_DEBOUNCE_MS = 30  # Start/end edits within this window share one redraw
+TIMELINE_TICK_STEPS = (1, 2, 5, 10, 30, 60, 120, 300, 600, 1800, 3600)  # Seconds
+TIMELINE_TICK_SPACING_PX = 60  # Minimum room for one tick label
 
 # FFmpeg Configuration
 FFMPEG_TIMEOUT_SECONDS = 300  # 5 minutes
 FFMPEG_VERSION_TIMEOUT = 5
+# Generous, as ffprobe may have to wait on a network share or spinning disk
+FFPROBE_TIMEOUT_SECONDS = 30
+
+# Cache Configuration
+CACHE_DIR = (
+    Path(
+        os.environ.get("LOCALAPPDATA")
+        or os.environ.get("XDG_CACHE_HOME")
+        or Path.home() / ".cache"
+    )
+    / "clipper"
+)
+# ffprobe results persisted across sessions so reopened files aren't re-probed
+MEDIA_INFO_CACHE_FILE = CACHE_DIR / "media_info.json"
+MEDIA_INFO_CACHE_MAX_ENTRIES = 256
 
 # Upload Configuration
 UPLOAD_TIMEOUT_SECONDS = 60
 UPLOAD_BOUNDARY_PREFIX = "----WebKitFormBoundary"
+UPLOAD_CHUNK_SIZE = 256 * 1024  # Bytes read from disk per socket write
+
+# Worker Configuration
+# Shared background threads for probing, encoding and uploading; reusing them
+# avoids spawning a fresh OS thread per task
+WORKER_MAX_THREADS = 4
 
 # UI Colors (Material Design inspired)
 COLORS = {
@@ -80,12 +128,78 @@ VIDEO_CODECS = [
     ("VP9", "libvpx-vp9"),
 ]
 
+# Hardware Video Codecs (offered only when the local FFmpeg build has them)
+HARDWARE_VIDEO_CODECS = [
+    ("H.264 (NVENC)", "h264_nvenc"),
+    ("H.265 (NVENC)", "hevc_nvenc"),
+    ("H.264 (QSV)", "h264_qsv"),
+    ("H.265 (QSV)", "hevc_qsv"),
+    ("H.264 (AMF)", "h264_amf"),
+    ("H.265 (AMF)", "hevc_amf"),
+    ("H.264 (VAAPI)", "h264_vaapi"),
+    ("H.265 (VAAPI)", "hevc_vaapi"),
+]
+VIDEO_CODEC_LABELS = tuple(label for label, val in VIDEO_CODECS)
+VIDEO_CODEC_LABEL_TO_VALUE = dict(VIDEO_CODECS + HARDWARE_VIDEO_CODECS)
+# Per-codec exceptions to the default CRF ceiling (51) and audio encoder (AAC)
+DEFAULT_CRF_MAX = 51
+CODEC_CRF_MAX = {"libvpx-vp9": 63}
+DEFAULT_AUDIO_ENCODER = "aac"
+CODEC_AUDIO_ENCODERS = {"libvpx-vp9": "libopus"}
+# Software encoders that support a two-pass target-size encode
+TWO_PASS_CODECS = ("libx264", "libx265", "libvpx-vp9")
+TWO_PASS_LOG_NAME = "clipper2pass"
+MIN_VIDEO_BITRATE_KBPS = 64
+# Clips up to this long encode faster with x264 slice threads than frame threads
+SLICED_THREADS_MAX_SECONDS = 15
+# Only the tail of FFmpeg's stderr is kept for error reporting
+FFMPEG_STDERR_MAX_LINES = 256
+FFMPEG_PROGRESS_TIME_KEY = b"out_time_us="
+
+FFMPEG_VERSION_REGEX = re.compile(r"ffmpeg version (\S+)")
+ENCODER_LIST_REGEX = re.compile(r"^ V\S* (\S+)", re.MULTILINE)
+VAAPI_DEVICE = "/dev/dri/renderD128"
+
+# Encoding preset equivalents for hardware encoders
+NVENC_PRESETS = {
+    "veryfast": "p2",
+    "fast": "p3",
+    "medium": "p4",
+    "slow": "p5",
+    "veryslow": "p7",
+}
+AMF_QUALITY_PRESETS = {
+    "veryfast": "speed",
+    "fast": "speed",
+    "medium": "balanced",
+    "slow": "quality",
+    "veryslow": "quality",
+}
+
+# Encoder Tuning (applied only where the encoder knows the tune)
+TUNE_OPTIONS = [
+    ("Auto", ""),
+    ("Film", "film"),
+    ("Animation", "animation"),
+    ("Grain", "grain"),
+    ("Low Latency", "zerolatency"),
+    ("SSIM", "ssim"),
+]
+TUNE_LABELS = tuple(label for label, val in TUNE_OPTIONS)
+TUNE_LABEL_TO_VALUE = dict(TUNE_OPTIONS)
+CODEC_TUNES = {
+    "libx264": frozenset(val for label, val in TUNE_OPTIONS if val),
+    "libx265": frozenset({"animation", "grain", "zerolatency", "ssim"}),
+}
+
 # Container Formats
 CONTAINER_FORMATS = [
     ("MP4", "mp4"),
     ("MKV", "mkv"),
     ("WebM", "webm"),
 ]
+CONTAINER_LABELS = tuple(label for label, val in CONTAINER_FORMATS)
+CONTAINER_EXTENSIONS = {label: f".{val}" for label, val in CONTAINER_FORMATS}
 
 # CRF Values
 CRF_OPTIONS = ["18", "20", "23", "25", "28"]
@@ -95,6 +209,7 @@ FPS_OPTIONS = ["24", "30", "60", "120"]
 
 # Audio Bitrate Options
 AUDIO_BITRATE_OPTIONS = ["320k", "256k", "192k", "128k", "96k", "64k", "Remove Audio"]
+AUDIO_BITRATE_REGEX = re.compile(r"^(\d{1,3})k$", re.IGNORECASE)
 
 # Resolution Options
 RESOLUTION_OPTIONS = [
@@ -105,6 +220,9 @@ RESOLUTION_OPTIONS = [
     ("854x480", "854:480"),
     ("640x360", "640:360"),
 ]
+RESOLUTION_LABELS = tuple(label for label, val in RESOLUTION_OPTIONS)
+RESOLUTION_LABEL_TO_VALUE = dict(RESOLUTION_OPTIONS)
+RESOLUTION_REGEX = re.compile(r"^\d{2,5}x\d{2,5}$")
 
 
 @dataclass
@@ -124,6 +242,34 @@ class AudioStream:
     title: str = ""
 
 
+@dataclass
+class EncodeSettings:
+    """Encoding options read from the UI on the Tk thread before a run."""
+
+    input_path: str
+    advanced: bool
+    trimming: bool
+    start_seconds: float = 0.0
+    duration: float = 0.0
+    # Length of the encoded span before speed changes; 0 if not yet known
+    total_duration: float = 0.0
+    codec: str = "libx264"
+    crf: str = "20"
+    fps: str = "120"
+    audio_bitrate: str = "128k"
+    resolution: str = "1920:1080"
+    preset: str = "medium"
+    speed: float = 1.0
+    container: str = "mp4"
+    target_size: str = ""
+    tune: str = ""
+    subtitle: Optional[SubtitleStream] = None
+    audio_index: int = 0
+    # Position of audio_index among the audio streams (-map 0:a:N); None if
+    # the input has no audio
+    audio_map: Optional[int] = None
+
+
 @dataclass
 class UploadService:
     key: str
@@ -133,6 +279,9 @@ class UploadService:
     reqtype: Optional[str]
     max_size_mb: int
     expiration: str
+    timeout: int = UPLOAD_TIMEOUT_SECONDS
+    # True if the service answers with JSON, False for a bare URL in plain text
+    json_response: bool = False
 
 
 UPLOAD_SERVICES_LIST: List[UploadService] = [
@@ -144,6 +293,7 @@ UPLOAD_SERVICES_LIST: List[UploadService] = [
         reqtype="fileupload",
         max_size_mb=200,
         expiration="Indefinite",
+        timeout=600,
     ),
     UploadService(
         key="uguu",
@@ -153,6 +303,7 @@ UPLOAD_SERVICES_LIST: List[UploadService] = [
         reqtype=None,
         max_size_mb=134,
         expiration="~3 hours",
+        json_response=True,
     ),
     UploadService(
         key="tempsh",
@@ -164,23 +315,506 @@ UPLOAD_SERVICES_LIST: List[UploadService] = [
         expiration="3 days",
     ),
 ]
+UPLOAD_SERVICES: Dict[str, UploadService] = {
+    service.key: service for service in UPLOAD_SERVICES_LIST
+}
 
 
 def get_upload_service_by_key(key: str) -> Optional[UploadService]:
+    return UPLOAD_SERVICES.get(key)
+
+
+class DaemonThreadPool:
+    """
+    A small fixed-size thread pool whose workers are daemon threads.
+
+    concurrent.futures.ThreadPoolExecutor joins its workers at interpreter
+    exit even after shutdown(wait=False), so a job blocked on a network
+    response or a child process would keep Clipper running with no window.
+    Daemon workers end with the process instead.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str):
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._work: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._idle = threading.Semaphore(0)
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Queue fn(*args, **kwargs) and return a Future for its result."""
+        future: Future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot submit after shutdown")
+            self._work.put((future, fn, args, kwargs))
+            # Reuse an idle worker if there is one, else start another
+            if not self._idle.acquire(blocking=False) and (
+                len(self._threads) < self._max_workers
+            ):
+                thread = threading.Thread(
+                    target=self._worker,
+                    name=f"{self._thread_name_prefix}_{len(self._threads)}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+        return future
+
+    def _worker(self) -> None:
+        while True:
+            item = self._work.get()
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as exc:
+                    future.set_exception(exc)
+                else:
+                    future.set_result(result)
+            self._idle.release()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work; workers exit once the queue is drained."""
+        with self._lock:
+            self._shutdown = True
+            threads = list(self._threads)
+        for _ in threads:
+            self._work.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
+
+
+WORKER_POOL = DaemonThreadPool(WORKER_MAX_THREADS, thread_name_prefix="clipper")
+
+
+MULTIPART_EPILOGUE_TEMPLATE = b"\r\n--%(boundary)b--\r\n"
+
+
+@lru_cache(maxsize=None)
+def multipart_preamble_template(
+    field_name: str, fields: Tuple[Tuple[str, str], ...]
+) -> bytes:
+    """
+    Return the multipart preamble for a form with the boundary and filename
+    left as %(boundary)b and %(filename)b, built once per form layout.
+    """
+    lines = []
+    for name, value in fields:
+        lines.append("--%(boundary)b")
+        lines.append(f'Content-Disposition: form-data; name="{name}"')
+        lines.append("")
+        lines.append(value.replace("%", "%%"))
+    lines.append("--%(boundary)b")
+    lines.append(
+        f'Content-Disposition: form-data; name="{field_name}"; '
+        'filename="%(filename)b"'
+    )
+    lines.append("Content-Type: video/mp4")
+    lines.append("")
+    lines.append("")
+    return "\r\n".join(lines).encode()
+
+
+class MultipartFileBody:
+    """
+    A multipart/form-data request body that streams one file from disk.
+
+    Iterating yields the form preamble, the file in UPLOAD_CHUNK_SIZE pieces
+    and the closing boundary, so memory use stays flat regardless of file
+    size. The length is known up front, letting http.client send a plain
+    Content-Length body instead of chunked encoding.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        field_name: str,
+        fields: Optional[Dict[str, str]] = None,
+        progress: Optional[Callable[[int], None]] = None,
+        file_size: Optional[int] = None,
+    ):
+        """
+        Args:
+            file_path: Path of the file to send
+            field_name: Form field name the service expects for the file
+            fields: Extra plain form fields sent before the file
+            progress: Called with the percentage sent whenever it changes
+            file_size: Size of the file if the caller already knows it
+        """
+        self.file_path = file_path
+        self.progress = progress
+        self.boundary = UPLOAD_BOUNDARY_PREFIX + secrets.token_hex(8)
+        template = multipart_preamble_template(
+            field_name, tuple((fields or {}).items())
+        )
+        values = {
+            b"boundary": self.boundary.encode(),
+            b"filename": os.path.basename(file_path).encode(),
+        }
+        self._preamble = template % values
+        self._epilogue = MULTIPART_EPILOGUE_TEMPLATE % values
+        if file_size is None:
+            file_size = os.path.getsize(file_path)
+        self.file_size = file_size
+        self.content_length = len(self._preamble) + self.file_size + len(self._epilogue)
+
+    def headers(self) -> Dict[str, str]:
+        return {
+            "Content-Type": f"multipart/form-data; boundary={self.boundary}",
+            "Content-Length": str(self.content_length),
+        }
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._preamble
+        sent = 0
+        last_percent = -1
+        # http.client sends each piece before asking for the next, so a single
+        # buffer can be refilled in place instead of allocating per chunk
+        buffer = bytearray(UPLOAD_CHUNK_SIZE)
+        view = memoryview(buffer)
+        with open(self.file_path, "rb", buffering=0) as f:
+            while True:
+                n = f.readinto(buffer)
+                if not n:
+                    break
+                yield view[:n]
+                sent += n
+                percent = sent * 100 // max(self.file_size, 1)
+                if self.progress and percent != last_percent:
+                    last_percent = percent
+                    self.progress(percent)
+        yield self._epilogue
+
+
+# Open upload connections per host, reused so repeat uploads skip the TLS handshake
+_https_connections: Dict[str, "http.client.HTTPSConnection"] = {}
+_https_connections_lock = threading.Lock()
+
+
+def https_post(
+    url: str,
+    body: Union[bytes, MultipartFileBody],
+    headers: Dict[str, str],
+    timeout: int,
+) -> bytes:
+    """
+    POST body to an HTTPS url over a pooled keep-alive connection.
+
+    Streaming bodies are sent piece by piece as they are iterated.
+
+    Returns:
+        The raw response body
+
+    Raises:
+        Exception: If the server answers with an HTTP error status
+    """
+    # Imported lazily: http.client pulls in ssl, which is slow to load at startup
+    import http.client
+    import ssl
+    import urllib.parse
+
+    parts = urllib.parse.urlsplit(url)
+    host = parts.netloc
+    with _https_connections_lock:
+        conn = _https_connections.pop(host, None)
+    reused = conn is not None
+    if conn is None:
+        conn = http.client.HTTPSConnection(host, timeout=timeout)
+    else:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+    while True:
+        try:
+            conn.request("POST", parts.path or "/", body=body, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+            break
+        except (ConnectionError, ssl.SSLError):
+            # Covers RemoteDisconnected and the TLS EOF/close_notify errors a
+            # server's idle-timeout close shows up as
+            conn.close()
+            if not reused:
+                raise
+            # The server dropped the idle pooled connection; retry once afresh
+            reused = False
+            conn = http.client.HTTPSConnection(host, timeout=timeout)
+        except Exception:
+            conn.close()
+            raise
+    with _https_connections_lock:
+        _https_connections.setdefault(host, conn)
+    if response.status >= 400:
+        raise Exception(f"HTTP Error {response.status}: {response.reason}")
+    return data
+
+
+def warm_upload_dns() -> None:
+    """
+    Resolve every upload host once in the background.
+
+    The OS resolver then usually has the answers cached by the time the user
+    uploads, taking the lookup off the first upload. Failures are ignored;
+    the upload simply resolves again.
+    """
+    import socket
+    import urllib.parse
+
     for service in UPLOAD_SERVICES_LIST:
-        if service.key == key:
-            return service
-    return None
+        host = urllib.parse.urlsplit(service.url).hostname
+        try:
+            socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+        except OSError:
+            pass
+
+
+_ffmpeg_version: Optional[str] = None
+
+
+def get_ffmpeg_version() -> Optional[str]:
+    """
+    Return the version string of the FFmpeg on PATH, or None if it won't run.
+
+    Only a successful answer is cached, so installing FFmpeg while the app
+    is open is picked up by the next check.
+    """
+    global _ffmpeg_version
+    if _ffmpeg_version is None:
+        try:
+            result = subprocess.run(
+                ["ffmpeg", "-version"],
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=FFMPEG_VERSION_TIMEOUT,
+            )
+        except (
+            subprocess.TimeoutExpired,
+            subprocess.CalledProcessError,
+            OSError,
+        ):
+            return None
+        match = FFMPEG_VERSION_REGEX.search(result.stdout)
+        _ffmpeg_version = match.group(1) if match else "unknown"
+    return _ffmpeg_version
+
+
+_media_info_cache: Optional[Dict[str, dict]] = None
+_media_info_cache_lock = threading.Lock()
+
+
+def _load_media_info_cache() -> Dict[str, dict]:
+    try:
+        with open(MEDIA_INFO_CACHE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_media_info_cache(cache: Dict[str, dict]) -> None:
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = MEDIA_INFO_CACHE_FILE.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, MEDIA_INFO_CACHE_FILE)
+    except OSError:
+        pass  # The cache is only an optimisation
+
+
+def probe_media(path: str) -> Optional[dict]:
+    """
+    Return ffprobe's format duration and stream list for a file.
+
+    One ffprobe run answers the duration, track and input-size questions
+    together. Results are cached on disk per path, size and modification
+    time, so a file that has been replaced or edited is probed again;
+    failed probes aren't stored.
+
+    Returns:
+        Parsed ffprobe JSON, or None if the file couldn't be probed
+    """
+    global _media_info_cache
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = f"{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}"
+    with _media_info_cache_lock:
+        if _media_info_cache is None:
+            _media_info_cache = _load_media_info_cache()
+        info = _media_info_cache.get(key)
+    if info is not None:
+        return info
+    try:
+        result = subprocess.run(
+            [
+                "ffprobe",
+                "-v",
+                "error",
+                "-show_entries",
+                "format=duration:stream=index,codec_type,codec_name,width,height,"
+                "r_frame_rate:stream_tags=language,title",
+                "-of",
+                "json",
+                path,
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=FFPROBE_TIMEOUT_SECONDS,
+        )
+        info = json.loads(result.stdout)
+    except (subprocess.SubprocessError, OSError, ValueError):
+        return None
+    with _media_info_cache_lock:
+        _media_info_cache[key] = info
+        while len(_media_info_cache) > MEDIA_INFO_CACHE_MAX_ENTRIES:
+            # Dicts keep insertion order, so this drops the oldest entry
+            del _media_info_cache[next(iter(_media_info_cache))]
+        _save_media_info_cache(_media_info_cache)
+    return info
+
+
+def probed_streams(info: Optional[dict], codec_type: str) -> List[dict]:
+    """Return the streams of one type ("video", "audio", ...) in file order."""
+    if not info:
+        return []
+    return [s for s in info.get("streams", []) if s.get("codec_type") == codec_type]
+
+
+def parse_frame_rate(rate: str) -> Optional[float]:
+    """Convert an ffprobe rational such as "30000/1001" to a float."""
+    num, _, den = rate.partition("/")
+    try:
+        return float(num) / float(den or 1)
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+_hardware_encoders: Optional[List[str]] = None
+
+
+def detect_hardware_encoders() -> List[str]:
+    """
+    Return the hardware video encoders available in the local FFmpeg build.
+
+    The result is cached, so ffmpeg is only asked once per session.
+    """
+    global _hardware_encoders
+    if _hardware_encoders is None:
+        try:
+            result = subprocess.run(
+                ["ffmpeg", "-hide_banner", "-encoders"],
+                capture_output=True,
+                text=True,
+                timeout=FFMPEG_VERSION_TIMEOUT,
+            )
+            found = set(ENCODER_LIST_REGEX.findall(result.stdout))
+        except (subprocess.TimeoutExpired, OSError):
+            found = set()
+        _hardware_encoders = [
+            val for label, val in HARDWARE_VIDEO_CODECS if val in found
+        ]
+    return _hardware_encoders
+
+
+def parse_time_strict(time_str: str) -> Tuple[float, str]:
+    """
+    Parse an M:SS or H:MM:SS string, explaining why it is invalid if so.
+
+    An empty string is accepted as 0 so untouched fields never error.
+
+    Returns:
+        Tuple of (seconds, error message); the message is empty when valid
+    """
+    if not time_str or not time_str.strip():
+        return 0.0, ""
+    format_error = f"Invalid time format: {time_str}\nPlease use MM:SS or HH:MM:SS"
+    parts = time_str.split(":")
+    try:
+        numbers = [int(part) for part in parts]
+    except ValueError:
+        return 0.0, format_error
+    if len(numbers) == 2:
+        minutes, seconds = numbers
+        if seconds >= 60:
+            return 0.0, f"Seconds must be 0-59, got {seconds}"
+        if minutes < 0:
+            return 0.0, f"Minutes cannot be negative: {minutes}"
+        return minutes * 60 + seconds, ""
+    if len(numbers) == 3:
+        hours, minutes, seconds = numbers
+        if seconds >= 60:
+            return 0.0, f"Seconds must be 0-59, got {seconds}"
+        if minutes >= 60:
+            return 0.0, f"Minutes must be 0-59, got {minutes}"
+        if hours < 0:
+            return 0.0, f"Hours cannot be negative: {hours}"
+        return hours * 3600 + minutes * 60 + seconds, ""
+    return 0.0, format_error
+
+
+@lru_cache(maxsize=64)
+def parse_time_to_seconds(time_str: str) -> float:
+    """
+    Convert an M:SS or H:MM:SS string to seconds, or 0 if it is invalid.
+
+    Cached because every redraw re-reads the same start and end strings.
+    Uses str.partition rather than split so the hot path builds no list;
+    parse_time_strict accepts the same grammar and explains rejections.
+    """
+    first, sep, rest = time_str.partition(":")
+    if not sep:
+        return 0.0
+    second, sep, third = rest.partition(":")
+    try:
+        if sep:
+            hours, minutes, seconds = int(first), int(second), int(third)
+            if seconds >= 60 or minutes >= 60 or hours < 0:
+                return 0.0
+            return hours * 3600 + minutes * 60 + seconds
+        minutes, seconds = int(first), int(second)
+        if seconds >= 60 or minutes < 0:
+            return 0.0
+        return minutes * 60 + seconds
+    except ValueError:
+        return 0.0
+
+
+def retarget_extension(name: str, ext: str) -> str:
+    """
+    Return the filename with any known video extension replaced by ext.
+    """
+    low = name.lower()
+    if low.endswith(ext):
+        return name
+    # Slice rather than str.removesuffix, which needs Python 3.9
+    for known_ext in VIDEO_EXTENSIONS:
+        if low.endswith(known_ext):
+            name = name[: -len(known_ext)]
+            break
+    return name + ext
 
 
 class FFmpegCommandBuilder:
     def __init__(self):
-        self.cmd = ["ffmpeg", "-y"]
+        # Progress goes to stdout as key=value lines; stderr keeps diagnostics
+        self.cmd = ["ffmpeg", "-y", "-hide_banner", "-loglevel", "warning"]
+        self.cmd += ["-progress", "pipe:1", "-nostats"]
         self._vf_filters = []
         self._af_filters = []
         self._has_subtitles = False
         self._has_speed = False
         self._setpts_filter = None
+        self._hwupload = False
 
     def with_input(self, path):
         self.cmd.extend(["-i", path])
@@ -240,7 +874,35 @@ class FFmpegCommandBuilder:
         return self
 
     def with_codec(self, codec, crf, preset):
-        self.cmd.extend(["-c:v", codec, "-crf", str(crf), "-preset", preset])
+        crf = str(crf)
+        if codec.endswith("_nvenc"):
+            self.cmd.extend(
+                ["-c:v", codec, "-preset", NVENC_PRESETS.get(preset, "p4")]
+                + ["-tune", "hq", "-rc", "vbr", "-cq", crf, "-b:v", "0"]
+            )
+        elif codec.endswith("_qsv"):
+            self.cmd.extend(["-c:v", codec, "-preset", preset, "-global_quality", crf])
+        elif codec.endswith("_amf"):
+            self.cmd.extend(
+                ["-c:v", codec, "-quality", AMF_QUALITY_PRESETS.get(preset, "balanced")]
+                + ["-rc", "cqp", "-qp_i", crf, "-qp_p", crf]
+            )
+        elif codec.endswith("_vaapi"):
+            # The device is a global option, so it must precede the input
+            self.cmd[1:1] = ["-vaapi_device", VAAPI_DEVICE]
+            self._hwupload = True
+            self.cmd.extend(["-c:v", codec, "-qp", crf])
+        else:
+            self.cmd.extend(["-c:v", codec, "-crf", crf, "-preset", preset])
+        return self
+
+    def with_bitrate(self, codec, bitrate_kbps, preset):
+        self.cmd.extend(["-c:v", codec, "-b:v", f"{bitrate_kbps}k", "-preset", preset])
+        return self
+
+    def with_tune(self, codec, tune):
+        if tune in CODEC_TUNES.get(codec, ()):
+            self.cmd.extend(["-tune", tune])
         return self
 
     def with_audio(self, codec, bitrate):
@@ -251,12 +913,35 @@ class FFmpegCommandBuilder:
         vf_chain = list(self._vf_filters)
         if self._has_speed and self._setpts_filter:
             vf_chain.append(self._setpts_filter)
+        if self._hwupload:
+            # Software filters run first, then frames move to the VAAPI surface
+            vf_chain.append("format=nv12,hwupload")
         if vf_chain:
             self.cmd.extend(["-vf", ",".join(vf_chain)])
         if self._af_filters:
             self.cmd.extend(["-filter:a", ",".join(self._af_filters)])
         return self.cmd + [output_path]
 
+    def build_two_pass(self, codec, output_path):
+        """
+        Build the analysis and encode commands for a two-pass encode.
+        Both passes must run with the stats directory as working directory,
+        since the stats file is referenced by a relative name.
+        Returns:
+            Tuple of (first pass command, second pass command)
+        """
+        base = self.build(output_path)[:-1]
+        passes = []
+        for number in (1, 2):
+            if codec == "libx265":
+                pass_args = ["-x265-params", f"pass={number}:stats={TWO_PASS_LOG_NAME}"]
+            else:
+                pass_args = ["-pass", str(number), "-passlogfile", TWO_PASS_LOG_NAME]
+            passes.append(base + pass_args)
+        # The first pass only gathers statistics, so nothing is written out
+        first = passes[0] + ["-an", "-sn", "-f", "null", os.devnull]
+        return first, passes[1] + [output_path]
+
     def get_upload_service_info(self, service: str) -> Optional[UploadService]:
         """
         Get information about an upload service as a dataclass.
@@ -318,6 +1003,9 @@ class ClipperGUI:
         self.root = root
         self.root.title("Clipper")
         self.root.resizable(True, True)
+        # Screen size rarely changes mid-session, read it once
+        self.screen_width: int = root.winfo_screenwidth()
+        self.screen_height: int = root.winfo_screenheight()
 
         # Configure style
         self.setup_styles()
@@ -332,21 +1020,52 @@ class ClipperGUI:
         self.start_time: tk.StringVar = tk.StringVar(value=DEFAULT_START_TIME)
         self.end_time: tk.StringVar = tk.StringVar(value=DEFAULT_END_TIME)
         self.video_duration: float = 0.0
+        # Input whose probe results are (or are about to be) in video_duration
+        self._probed_path: Optional[str] = None
+        # (canvas width, duration) the timeline ruler was last drawn for
+        self._timeline_static_key: Optional[tuple] = None
+        # Canvas width from the last <Configure>, and the pixels per second
+        # derived from it, so pointer handlers skip winfo_width() round-trips
+        self._timeline_width: int = 800
+        self._px_per_sec: float = 0.0
+        self._time_update_job: Optional[str] = None
+        # (input path, output base name) so trim edits don't re-derive the stem
+        self._output_base_cache: Optional[tuple] = None
         self.dragging_start: bool = False
         self.dragging_end: bool = False
         self.save_as_enabled: tk.BooleanVar = tk.BooleanVar(value=False)
         self.advanced_enabled: tk.BooleanVar = tk.BooleanVar(value=False)
         self.auto_copy_url: tk.BooleanVar = tk.BooleanVar(value=False)
         self.last_output_path: Optional[str] = None
+        # Size of last_output_path, read once for the per-service limit check
+        self._output_size_bytes: Optional[int] = None
+        self._size_warning_shown: bool = False
         self.upload_service: tk.StringVar = tk.StringVar(value="catbox")
         self.upload_url: tk.StringVar = tk.StringVar(value="")
 
         # Processing state
         self.cancel_requested: bool = False
         self.ffmpeg_process: Optional[subprocess.Popen] = None
-        self.processing_thread: Optional[threading.Thread] = None
+        self.processing_future: Optional[Future] = None
+        self._closing: bool = False
+        # Inputs set_processing_ui_state last applied widget states for
+        self._ui_state_key: Optional[tuple] = None
+        # Pending "Copied" -> "Copy" label reset, restarted by each copy
+        self._copy_reset_job: Optional[str] = None
+        # Latest encode percentage not yet shown; one Tk callback flushes it
+        self._pending_progress: Optional[int] = None
+        self._progress_lock = threading.Lock()
+
+        # Variable writes queued by set_var_deferred, applied in one idle pass
+        self._pending_var_updates: Dict[str, tuple] = {}
+        self._var_flush_scheduled: bool = False
 
         self.setup_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Look for hardware encoders without delaying the first paint
+        WORKER_POOL.submit(self._detect_hardware_codecs_bg)
+        WORKER_POOL.submit(warm_upload_dns)
 
         # --- Widget grouping for UI state ---
         self.main_controls = [
@@ -370,6 +1089,8 @@ class ClipperGUI:
             self.container_menu,
             self.track_selection_frame,
             self.speed_menu,
+            self.target_size_entry,
+            self.tune_menu,
         ]
         self.upload_controls = [
             self.catbox_radio,
@@ -386,6 +1107,10 @@ class ClipperGUI:
     def setup_styles(self) -> None:
         """Configure the application's visual styles and themes."""
         style = ttk.Style()
+        # Styles live in the Tcl interpreter, so a second window on the same
+        # root finds them already set up and can skip the round-trips
+        if style.lookup("Subtitle.TLabel", "font"):
+            return
         style.theme_use("clam")
         c = COLORS  # Use the global COLORS constant
 
@@ -719,6 +1444,7 @@ class ClipperGUI:
         self.timeline_canvas.bind("<Button-1>", self.on_timeline_click)
         self.timeline_canvas.bind("<B1-Motion>", self.on_timeline_drag)
         self.timeline_canvas.bind("<ButtonRelease-1>", self.on_timeline_release)
+        self.timeline_canvas.bind("<Configure>", self.on_timeline_resize)
         time_controls_frame = ttk.Frame(self.timeline_frame)
         time_controls_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 8))
         # Start time
@@ -754,6 +1480,13 @@ class ClipperGUI:
             font=("Segoe UI", 9, "bold"),
         )
         self.duration_label.grid(row=1, column=0, pady=(4, 0))
+        # Shown while Advanced is off, when trims are stream-copied
+        self.fast_trim_label = ttk.Label(
+            self.timeline_frame,
+            text="Fast trim: stream copy (cuts snap to the nearest keyframe)",
+            style="Info.TLabel",
+        )
+        self.fast_trim_label.grid(row=2, column=0, sticky=tk.W)
 
     def _setup_output_section(self, container):
         ttk.Label(container, text="Output Filename:", style="Subtitle.TLabel").grid(
@@ -851,9 +1584,9 @@ class ClipperGUI:
         self.codec_menu = ttk.Combobox(
             self.advanced_frame,
             textvariable=self.selected_codec,
-            values=[label for label, val in VIDEO_CODECS],
+            values=VIDEO_CODEC_LABELS,
             state="readonly",
-            width=12,
+            width=14,
             font=("Segoe UI", 9),
         )
         self.codec_menu.grid(row=1, column=0, sticky=(tk.W, tk.E), padx=(0, 8))
@@ -915,7 +1648,7 @@ class ClipperGUI:
         self.resolution_menu = ttk.Combobox(
             self.advanced_frame,
             textvariable=self.selected_resolution,
-            values=[label for label, val in RESOLUTION_OPTIONS],
+            values=RESOLUTION_LABELS,
             state="normal",
             width=10,
             font=("Segoe UI", 9),
@@ -930,7 +1663,7 @@ class ClipperGUI:
         self.container_menu = ttk.Combobox(
             self.advanced_frame,
             textvariable=self.selected_container,
-            values=[label for label, val in CONTAINER_FORMATS],
+            values=CONTAINER_LABELS,
             state="readonly",
             width=8,
             font=("Segoe UI", 9),
@@ -987,6 +1720,34 @@ class ClipperGUI:
         self.audio_combobox_holder.grid(row=0, column=1, sticky="nsew", padx=(8, 0))
         self.audio_combobox_holder.grid_remove()
 
+        # Target Size (two-pass encode when set, CRF otherwise)
+        ttk.Label(
+            self.advanced_frame, text="Target Size (MB):", style="Subtitle.TLabel"
+        ).grid(row=4, column=0, sticky=tk.W)
+        self.target_size_mb = tk.StringVar(value="")
+        self.target_size_entry = ttk.Entry(
+            self.advanced_frame,
+            textvariable=self.target_size_mb,
+            width=8,
+            font=("Segoe UI", 9),
+        )
+        self.target_size_entry.grid(row=5, column=0, sticky=(tk.W, tk.E), padx=(0, 8))
+
+        # Tune (H.264/H.265 only)
+        ttk.Label(self.advanced_frame, text="Tune:", style="Subtitle.TLabel").grid(
+            row=4, column=1, sticky=tk.W
+        )
+        self.selected_tune = tk.StringVar(value="Auto")
+        self.tune_menu = ttk.Combobox(
+            self.advanced_frame,
+            textvariable=self.selected_tune,
+            values=TUNE_LABELS,
+            state="readonly",
+            width=10,
+            font=("Segoe UI", 9),
+        )
+        self.tune_menu.grid(row=5, column=1, sticky=(tk.W, tk.E), padx=(0, 8))
+
         self.advanced_frame.grid_remove()
 
     def _setup_status_section(self, container):
@@ -1130,6 +1891,7 @@ class ClipperGUI:
         self.input_file.trace("w", self.on_file_selected)
         self.start_time.trace("w", self.on_time_changed)
         self.end_time.trace("w", self.on_time_changed)
+        self.upload_service.trace("w", self.check_upload_size_limit)
 
     def toggle_trim_section(self):
         """Show/hide the trimming section based on checkbox state"""
@@ -1141,94 +1903,130 @@ class ClipperGUI:
             self.timeline_frame.grid_remove()
             self.start_entry.config(state="disabled")
             self.end_entry.config(state="disabled")
+        self._ui_state_key = None
+        # One idle-task flush settles the new layout; geometry("") then lets
+        # the window shrink or grow to fit it
         self.root.update_idletasks()
         self.root.geometry("")
-        self.root.update()
 
     def browse_input_file(self) -> None:
         """Open file dialog to select input video file."""
-        filetypes = [
-            ("Video files", f"*{' *'.join(SUPPORTED_VIDEO_FORMATS)}"),
-            ("MP4 files", "*.mp4"),
-            ("All files", "*.*"),
-        ]
         filename = filedialog.askopenfilename(
-            title="Select input video file", filetypes=filetypes
+            title="Select input video file", filetypes=BROWSE_FILETYPES
         )
         if filename:
             self.input_file.set(filename)
 
     def on_file_selected(self, *args):
         input_path = self.input_file.get()
+        if not input_path:
+            self._probed_path = None
         if input_path and os.path.exists(input_path):
-            # Fetch duration in a background thread to avoid UI freeze
-            def _update_duration_bg():
-                self.get_video_duration(input_path)
-                self.root.after(0, self.draw_timeline)
-
-            threading.Thread(target=_update_duration_bg, daemon=True).start()
             self.update_output_name()
             filename = os.path.basename(input_path)
             self.file_info_label.config(
                 text=f"Selected: {filename}", style="Success.TLabel"
             )
-            # Detect subtitle and audio streams
-            subs = self.get_video_subtitle_streams(input_path)
-            self.subtitle_streams = subs
-            audio_streams = self.get_video_audio_streams(input_path)
-            self.audio_streams = audio_streams
-            self.audio_indices = [s.index for s in audio_streams]
-
-            # Show track selection checkbox if we have any tracks
-            if subs or audio_streams:
-                self.include_tracks_checkbox.grid()
-                # Setup track selection UI based on container format
-                self.setup_track_selection_ui(subs, audio_streams)
-            else:
-                self.include_tracks_checkbox.grid_remove()
-                self.include_tracks.set(False)
-                self.track_selection_frame.grid_remove()
+            # The cached probe results are still valid for the same input
+            if input_path == self._probed_path:
+                return
+            self._probed_path = input_path
+
+            # Run the ffprobe calls in a background thread to avoid UI freeze
+            def _probe_bg():
+                duration = self.get_video_duration(input_path)
+                if input_path != self._probed_path:
+                    return  # Another file was picked meanwhile; skip its streams
+                subs = self.get_video_subtitle_streams(input_path)
+                audio_streams = self.get_video_audio_streams(input_path)
+                self.root.after(
+                    0,
+                    self._apply_probe_results,
+                    input_path,
+                    duration,
+                    subs,
+                    audio_streams,
+                )
 
-            if not self.is_processing:
-                self.set_processing_ui_state(False)
+            WORKER_POOL.submit(_probe_bg)
+
+    def _apply_probe_results(self, input_path, duration, subs, audio_streams):
+        """Apply background ffprobe results on the Tk thread."""
+        if input_path != self._probed_path:
+            return  # Superseded by a later selection or a reset
+        self.video_duration = duration
+        if duration > 0:
+            self.end_time.set(self.seconds_to_time(duration))
+        else:
+            # Let the next selection of this file probe it again
+            self._probed_path = None
+        self.draw_timeline()
+
+        self.subtitle_streams = subs
+        self.audio_streams = audio_streams
+        self.audio_indices = [s.index for s in audio_streams]
+
+        # Show track selection checkbox if we have any tracks
+        if subs or audio_streams:
+            self.include_tracks_checkbox.grid()
+            # Setup track selection UI based on container format
+            self.setup_track_selection_ui(subs, audio_streams)
+        else:
+            self.include_tracks_checkbox.grid_remove()
+            self.include_tracks.set(False)
+            self.track_selection_frame.grid_remove()
+
+        if not self.is_processing:
+            self.set_processing_ui_state(False)
 
-            # Update container-specific UI state
-            self.on_container_changed()
+        # Update container-specific UI state
+        self.on_container_changed()
 
-    def get_video_duration(self, video_path):
+    def get_video_duration(self, video_path) -> float:
+        """
+        Return the duration of a video in seconds, or 0 on failure.
+
+        Safe to call from worker threads; it does not touch any Tk state.
+        """
+        info = probe_media(video_path)
         try:
-            cmd = [
-                "ffprobe",
-                "-v",
-                "quiet",
-                "-show_entries",
-                "format=duration",
-                "-of",
-                "json",
-                video_path,
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            data = json.loads(result.stdout)
-            self.video_duration = float(data["format"]["duration"])
-            self.end_time.set(self.seconds_to_time(self.video_duration))
-            self.draw_timeline()
-        except Exception:
-            self.video_duration = 0
+            return float(info["format"]["duration"])
+        except (TypeError, KeyError, ValueError):
+            return 0.0
 
     def draw_timeline(self):
-        self.timeline_canvas.delete("all")
         if self.video_duration <= 0:
+            # Only wipe the canvas once; later calls have nothing to clear
+            if self._timeline_static_key is not None:
+                self.timeline_canvas.delete("all")
+                self._timeline_static_key = None
             return
-        canvas_width = self.timeline_canvas.winfo_width()
+        canvas_width = self._timeline_width
         if canvas_width <= 1:
-            canvas_width = 800
+            return  # Canvas not mapped yet
+        # The ruler only changes with the width or the video; handles just move
+        static_key = (canvas_width, self.video_duration)
+        if static_key != self._timeline_static_key:
+            self._px_per_sec = canvas_width / self.video_duration
+            self._draw_timeline_static(canvas_width)
+            self._timeline_static_key = static_key
+        self._update_timeline_handles()
+
+    def _draw_timeline_static(self, canvas_width):
+        """Draw the ruler and create the handle items, positioned later."""
+        self.timeline_canvas.delete("all")
         # Draw background
         self.timeline_canvas.create_rectangle(
             0, 25, canvas_width, 55, fill="#404040", outline="#505050", width=1
         )
-        # Draw time markers
-        for i in range(0, int(self.video_duration) + 1, 10):
-            x = (i / self.video_duration) * canvas_width
+        # Draw time markers, spaced so the count stays readable at any length
+        target_ticks = max(8, min(20, canvas_width // TIMELINE_TICK_SPACING_PX))
+        step = next(
+            (s for s in TIMELINE_TICK_STEPS if self.video_duration / s <= target_ticks),
+            TIMELINE_TICK_STEPS[-1],
+        )
+        for i in range(0, int(self.video_duration) + 1, step):
+            x = i * self._px_per_sec
             self.timeline_canvas.create_line(x, 20, x, 60, fill="#606060", width=1)
             self.timeline_canvas.create_text(
                 x,
@@ -1237,16 +2035,11 @@ class ClipperGUI:
                 font=("Segoe UI", 7),
                 fill="#CCCCCC",
             )
-        # Draw start and end handles
-        start_seconds = self.time_to_seconds(self.start_time.get())
-        end_seconds = self.time_to_seconds(self.end_time.get())
-        start_x = (start_seconds / self.video_duration) * canvas_width
-        end_x = (end_seconds / self.video_duration) * canvas_width
         # Start handle (green)
         self.timeline_canvas.create_rectangle(
-            start_x - 8,
+            0,
             12,
-            start_x + 8,
+            0,
             68,
             fill="#4CAF50",
             outline="#388E3C",
@@ -1254,13 +2047,18 @@ class ClipperGUI:
             tags="start_handle",
         )
         self.timeline_canvas.create_text(
-            start_x, 70, text="START", font=("Segoe UI", 7, "bold"), fill="#4CAF50"
+            0,
+            70,
+            text="START",
+            font=("Segoe UI", 7, "bold"),
+            fill="#4CAF50",
+            tags="start_label",
         )
         # End handle (red)
         self.timeline_canvas.create_rectangle(
-            end_x - 8,
+            0,
             12,
-            end_x + 8,
+            0,
             68,
             fill="#F44336",
             outline="#D32F2F",
@@ -1268,35 +2066,49 @@ class ClipperGUI:
             tags="end_handle",
         )
         self.timeline_canvas.create_text(
-            end_x, 70, text="END", font=("Segoe UI", 7, "bold"), fill="#F44336"
+            0,
+            70,
+            text="END",
+            font=("Segoe UI", 7, "bold"),
+            fill="#F44336",
+            tags="end_label",
         )
-        # Highlight selected region
+        # Selected region highlight
+        self.timeline_canvas.create_rectangle(
+            0,
+            25,
+            0,
+            55,
+            fill="#2196F3",
+            stipple="gray50",
+            outline="#1976D2",
+            width=1,
+            tags="selection",
+        )
+
+    def _update_timeline_handles(self):
+        """Move the handles and selection to the current start and end times."""
+        start_x = self.time_to_seconds(self.start_time.get()) * self._px_per_sec
+        end_x = self.time_to_seconds(self.end_time.get()) * self._px_per_sec
+        canvas = self.timeline_canvas
+        canvas.coords("start_handle", start_x - 8, 12, start_x + 8, 68)
+        canvas.coords("start_label", start_x, 70)
+        canvas.coords("end_handle", end_x - 8, 12, end_x + 8, 68)
+        canvas.coords("end_label", end_x, 70)
         if start_x < end_x:
-            self.timeline_canvas.create_rectangle(
-                start_x,
-                25,
-                end_x,
-                55,
-                fill="#2196F3",
-                stipple="gray50",
-                outline="#1976D2",
-                width=1,
-            )
-        self.timeline_canvas.update_idletasks()
-        self.timeline_canvas.update()
+            canvas.coords("selection", start_x, 25, end_x, 55)
+            canvas.itemconfigure("selection", state="normal")
+        else:
+            canvas.itemconfigure("selection", state="hidden")
 
     def on_timeline_click(self, event):
-        if self.video_duration <= 0:
+        if self.video_duration <= 0 or self._px_per_sec <= 0:
             return
-        canvas_width = self.timeline_canvas.winfo_width()
-        if canvas_width <= 1:
-            canvas_width = 800
-        click_ratio = event.x / canvas_width
-        click_seconds = click_ratio * self.video_duration
+        click_seconds = event.x / self._px_per_sec
         start_seconds = self.time_to_seconds(self.start_time.get())
         end_seconds = self.time_to_seconds(self.end_time.get())
-        start_x = (start_seconds / self.video_duration) * canvas_width
-        end_x = (end_seconds / self.video_duration) * canvas_width
+        start_x = start_seconds * self._px_per_sec
+        end_x = end_seconds * self._px_per_sec
         if abs(event.x - start_x) < 12:
             self.dragging_start = True
         elif abs(event.x - end_x) < 12:
@@ -1308,23 +2120,43 @@ class ClipperGUI:
                 self.end_time.set(self.seconds_to_time(click_seconds))
 
     def on_timeline_drag(self, event):
-        if self.video_duration <= 0:
+        if self.video_duration <= 0 or self._px_per_sec <= 0:
             return
-        canvas_width = self.timeline_canvas.winfo_width()
-        if canvas_width <= 1:
-            canvas_width = 800
-        drag_ratio = max(0, min(1, event.x / canvas_width))
-        drag_seconds = drag_ratio * self.video_duration
+        drag_seconds = max(0, min(self.video_duration, event.x / self._px_per_sec))
         if self.dragging_start:
-            self.start_time.set(self.seconds_to_time(drag_seconds))
+            var = self.start_time
         elif self.dragging_end:
-            self.end_time.set(self.seconds_to_time(drag_seconds))
+            var = self.end_time
+        else:
+            return
+        # Most motion events stay within the same whole second; only write
+        # (and fire the time traces) when the displayed value changes
+        new_time = self.seconds_to_time(drag_seconds)
+        if new_time != var.get():
+            var.set(new_time)
+            # Move the handle now; labels and the output name follow debounced
+            self.draw_timeline()
+
+    def on_timeline_resize(self, event):
+        if event.width > 1:
+            self._timeline_width = event.width
+        # A new width invalidates the ruler, so draw_timeline rebuilds it
+        self.draw_timeline()
 
     def on_timeline_release(self, event):
         self.dragging_start = False
         self.dragging_end = False
 
     def on_time_changed(self, *args):
+        # Coalesce bursts of trace callbacks (typing, dragging) into one update
+        if self._time_update_job is not None:
+            self.root.after_cancel(self._time_update_job)
+        self._time_update_job = self.root.after(
+            TIME_UPDATE_DEBOUNCE_MS, self._do_time_update
+        )
+
+    def _do_time_update(self):
+        self._time_update_job = None
         # Don't auto-correct user input, just update display
         self.update_duration()
         self.draw_timeline()
@@ -1349,32 +2181,9 @@ class ClipperGUI:
         Returns:
             Time in seconds, or 0 if invalid
         """
-        try:
-            parts = time_str.split(":")
-
-            if len(parts) == 2:
-                minutes, seconds = map(int, parts)
-                if seconds >= 60:
-                    return 0.0  # Invalid, but don't show error yet
-                if minutes < 0:
-                    return 0.0  # Invalid, but don't show error yet
-                return minutes * 60 + seconds
-
-            elif len(parts) == 3:
-                hours, minutes, seconds = map(int, parts)
-                if seconds >= 60:
-                    return 0.0  # Invalid, but don't show error yet
-                if minutes >= 60:
-                    return 0.0  # Invalid, but don't show error yet
-                if hours < 0:
-                    return 0.0  # Invalid, but don't show error yet
-                return hours * 3600 + minutes * 60 + seconds
-
-            else:
-                return 0.0  # Invalid format, but don't show error yet
-
-        except (ValueError, TypeError):
-            return 0.0  # Invalid input, but don't show error yet
+        if not isinstance(time_str, str):
+            return 0.0
+        return parse_time_to_seconds(time_str)
 
     def validate_time_format(self, time_str: str) -> bool:
         """
@@ -1386,64 +2195,11 @@ class ClipperGUI:
         Returns:
             True if valid, False otherwise
         """
-        # Handle empty strings - not an error
-        if not time_str or time_str.strip() == "":
-            return True
-
-        try:
-            parts = time_str.split(":")
-
-            if len(parts) == 2:
-                minutes, seconds = map(int, parts)
-                if seconds >= 60:
-                    messagebox.showerror(
-                        "Invalid Time",
-                        f"Seconds must be 0-59, got {seconds}",
-                    )
-                    return False
-                if minutes < 0:
-                    messagebox.showerror(
-                        "Invalid Time",
-                        f"Minutes cannot be negative: {minutes}",
-                    )
-                    return False
-                return True
-
-            elif len(parts) == 3:
-                hours, minutes, seconds = map(int, parts)
-                if seconds >= 60:
-                    messagebox.showerror(
-                        "Invalid Time",
-                        f"Seconds must be 0-59, got {seconds}",
-                    )
-                    return False
-                if minutes >= 60:
-                    messagebox.showerror(
-                        "Invalid Time",
-                        f"Minutes must be 0-59, got {minutes}",
-                    )
-                    return False
-                if hours < 0:
-                    messagebox.showerror(
-                        "Invalid Time",
-                        f"Hours cannot be negative: {hours}",
-                    )
-                    return False
-                return True
-
-            else:
-                messagebox.showerror(
-                    "Invalid Time",
-                    f"Invalid time format: {time_str}\nPlease use MM:SS or HH:MM:SS",
-                )
-                return False
-
-        except (ValueError, TypeError):
-            messagebox.showerror(
-                "Invalid Time",
-                f"Invalid time format: {time_str}\nPlease use MM:SS or HH:MM:SS",
-            )
+        _, error = parse_time_strict(time_str)
+        if error:
+            messagebox.showerror("Invalid Time", error)
             return False
+        return True
 
     def seconds_to_time(self, seconds: float) -> str:
         """
@@ -1469,16 +2225,20 @@ class ClipperGUI:
         Returns:
             Sanitized filename safe for Windows
         """
-        return re.sub(r'[<>:"/\\|?*]', "_", name)
+        return INVALID_FILENAME_CHARS_REGEX.sub("_", name)
 
     def update_output_name(self, *args) -> None:
         """Update the output filename based on current settings."""
         input_path = self.input_file.get()
         if input_path:
-            input_path_obj = Path(input_path)
-            base_name = self.sanitize_filename(input_path_obj.stem)
-            if input_path_obj.suffix.lower() in SUPPORTED_VIDEO_FORMATS:
-                base_name = input_path_obj.stem
+            if self._output_base_cache and self._output_base_cache[0] == input_path:
+                base_name = self._output_base_cache[1]
+            else:
+                stem, suffix = os.path.splitext(os.path.basename(input_path))
+                base_name = self.sanitize_filename(stem)
+                if suffix.lower() in SUPPORTED_VIDEO_EXTENSIONS:
+                    base_name = stem
+                self._output_base_cache = (input_path, base_name)
             if self.trim_enabled.get():
                 start_str = self.start_time.get().replace(":", "-")
                 end_str = self.end_time.get().replace(":", "-")
@@ -1486,13 +2246,29 @@ class ClipperGUI:
             else:
                 output_name = f"{base_name}-clip"
             # Extension based on container
-            container_label = self.selected_container.get()
-            ext = ".mp4"
-            for label, val in CONTAINER_FORMATS:
-                if label == container_label:
-                    ext = f".{val}"
-            output_name += ext
-            self.custom_output_name.set(output_name)
+            output_name += self.get_container_extension()
+            self.set_var_deferred(self.custom_output_name, output_name)
+
+    def set_var_deferred(self, var: tk.Variable, value) -> None:
+        """
+        Queue a Tk variable write to be applied when Tk is next idle.
+
+        Repeated writes to the same variable before then collapse into one,
+        so bursts of trace callbacks (e.g. timeline drags) set it only once.
+        """
+        self._pending_var_updates[str(var)] = (var, value)
+        if not self._var_flush_scheduled:
+            self._var_flush_scheduled = True
+            self.root.after_idle(self.flush_var_updates)
+
+    def flush_var_updates(self) -> None:
+        """Apply all queued variable writes now."""
+        self._var_flush_scheduled = False
+        pending = self._pending_var_updates
+        self._pending_var_updates = {}
+        for var, value in pending.values():
+            if var.get() != value:
+                var.set(value)
 
     def _validate_inputs(self):
         """Validate all user inputs before processing"""
@@ -1509,22 +2285,20 @@ class ClipperGUI:
             messagebox.showerror("Error", "Please select an input video file first!")
             return False
 
-        input_path = Path(self.input_file.get())
-        if not input_path.exists():
+        if not os.path.exists(self.input_file.get()):
             messagebox.showerror("Error", "Input file does not exist!")
             return False
 
         # Validate time inputs if trimming is enabled
         if self.trim_enabled.get():
-            # Validate time formats first
-            if not self.validate_time_format(self.start_time.get()):
-                return False
-            if not self.validate_time_format(self.end_time.get()):
+            # Parse each field once; the seconds feed the range checks below
+            start_seconds, error = parse_time_strict(self.start_time.get())
+            if not error:
+                end_seconds, error = parse_time_strict(self.end_time.get())
+            if error:
+                messagebox.showerror("Invalid Time", error)
                 return False
 
-            start_seconds = self.time_to_seconds(self.start_time.get())
-            end_seconds = self.time_to_seconds(self.end_time.get())
-
             if start_seconds >= end_seconds:
                 messagebox.showerror("Error", "Start time must be before end time!")
                 return False
@@ -1537,6 +2311,16 @@ class ClipperGUI:
 
     def set_processing_ui_state(self, processing: bool):
         """Enable/disable widgets based on processing state using grouped widget lists."""
+        # Skip the Tcl round-trips when nothing the states depend on has changed
+        state_key = (
+            processing,
+            self.advanced_enabled.get(),
+            self.subtitle_combobox,
+            self.audio_combobox,
+        )
+        if state_key == self._ui_state_key:
+            return
+        self._ui_state_key = state_key
         state = "disabled" if processing else "normal"
         for widget in self.main_controls:
             widget.config(state=state)
@@ -1565,11 +2349,13 @@ class ClipperGUI:
 
     def get_output_path(self) -> Optional[str]:
         """Centralized output file path and extension logic with logging and extension validation."""
+        if self._time_update_job is not None:
+            # A trim edit is still pending; fold it into the output name now
+            self.root.after_cancel(self._time_update_job)
+            self._do_time_update()
+        self.flush_var_updates()
         container_label = self.selected_container.get()
-        ext = ".mp4"
-        for label, val in CONTAINER_FORMATS:
-            if label == container_label:
-                ext = f".{val}"
+        ext = self.get_container_extension()
         if self.save_as_enabled.get():
             output_path = filedialog.asksaveasfilename(
                 defaultextension=ext,
@@ -1588,13 +2374,8 @@ class ClipperGUI:
             self.custom_output_name.set(os.path.basename(output_path))
             return output_path
         else:
-            input_path_obj = Path(self.input_file.get())
-            output_name = self.custom_output_name.get()
-            if not output_name.endswith(ext):
-                output_name_path = Path(output_name)
-                output_name = str(output_name_path.with_suffix(ext))
-            output_path = input_path_obj.parent / output_name
-            return str(output_path)
+            output_name = retarget_extension(self.custom_output_name.get(), ext)
+            return os.path.join(os.path.dirname(self.input_file.get()), output_name)
 
     def process_video(self):
         if self.is_processing:
@@ -1612,14 +2393,14 @@ class ClipperGUI:
             # CRF
             crf = self.selected_crf.get()
             codec_label = self.selected_codec.get()
+            codec = VIDEO_CODEC_LABEL_TO_VALUE.get(codec_label)
+            if codec is None:
+                messagebox.showerror("Error", f"Unknown codec: {codec_label}")
+                return
             try:
                 crf_val = int(crf)
-                if codec_label == "VP9":
-                    if not (0 <= crf_val <= 63):
-                        raise ValueError
-                else:
-                    if not (0 <= crf_val <= 51):
-                        raise ValueError
+                if not (0 <= crf_val <= CODEC_CRF_MAX.get(codec, DEFAULT_CRF_MAX)):
+                    raise ValueError
             except Exception:
                 messagebox.showerror(
                     "Error",
@@ -1638,18 +2419,15 @@ class ClipperGUI:
             # Audio Bitrate
             audio_bitrate = self.selected_audio_bitrate.get()
             if audio_bitrate != "Remove Audio":
-                try:
-                    ab_val = int(audio_bitrate[:-1])
-                    if not (8 <= ab_val <= 512):
-                        raise ValueError
-                except Exception:
+                match = AUDIO_BITRATE_REGEX.match(audio_bitrate)
+                if not match or not (8 <= int(match.group(1)) <= 512):
                     messagebox.showerror(
                         "Error", "Audio Bitrate must be between 8k and 512k."
                     )
                     return
             # Resolution
             res = self.selected_resolution.get()
-            if not re.match(r"^\d{2,5}x\d{2,5}$", res):
+            if not RESOLUTION_REGEX.match(res):
                 messagebox.showerror(
                     "Error",
                     "Resolution must be in the form WIDTHxHEIGHT, e.g., 1920x1080.",
@@ -1661,13 +2439,37 @@ class ClipperGUI:
                     "Error", "Resolution width and height must be between 16 and 7680."
                 )
                 return
+            # Target Size
+            target_size = self.target_size_mb.get().strip()
+            if target_size:
+                try:
+                    target_mb = float(target_size)
+                    if not math.isfinite(target_mb) or target_mb <= 0:
+                        raise ValueError
+                except Exception:
+                    messagebox.showerror(
+                        "Error", "Target Size must be a positive number of megabytes."
+                    )
+                    return
+                if codec not in TWO_PASS_CODECS:
+                    messagebox.showerror(
+                        "Error",
+                        "Target Size needs a software codec (H.264, H.265 or VP9).",
+                    )
+                    return
         # Use output path helper
         output_path = self.get_output_path()
         if not output_path:
             return
-        self.start_processing(str(output_path))
+        self.start_processing(output_path)
 
     def start_processing(self, output_path):
+        settings = self.collect_encode_settings()
+        if settings is None:
+            return
+        # Two-pass encodes run FFmpeg inside a temp dir, so a path typed
+        # relative to the working directory must be resolved first
+        output_path = os.path.abspath(output_path)
         self.is_processing = True
         self.cancel_requested = False
         self.ffmpeg_process = None
@@ -1681,239 +2483,262 @@ class ClipperGUI:
         self.progress_bar["value"] = 0
         self.progress_bar.pack(fill="x", expand=True)
         self.set_processing_ui_state(True)
-        thread = threading.Thread(
-            target=self.run_ffmpeg_with_progress, args=(output_path,)
+        self.processing_future = WORKER_POOL.submit(
+            self.run_ffmpeg_with_progress, settings, output_path
         )
-        thread.daemon = True
-        self.processing_thread = thread
-        thread.start()
         self.last_output_path = output_path
 
-    def run_ffmpeg_with_progress(self, output_path):
+    def collect_encode_settings(self) -> Optional[EncodeSettings]:
+        """
+        Read every encoding option from the UI.
+
+        Must run on the Tk thread; the encode worker only sees the snapshot.
+
+        Returns:
+            The settings, or None after showing an error if the codec
+            combobox holds a label that isn't a known codec
+        """
+        codec = None
+        if self.advanced_enabled.get():
+            codec_label = self.selected_codec.get()
+            codec = VIDEO_CODEC_LABEL_TO_VALUE.get(codec_label)
+            if codec is None:
+                messagebox.showerror("Error", f"Unknown codec: {codec_label}")
+                return None
+        settings = EncodeSettings(
+            input_path=os.path.abspath(self.input_file.get()),
+            advanced=self.advanced_enabled.get(),
+            trimming=self.trim_enabled.get(),
+        )
+        if settings.trimming:
+            settings.start_seconds = self.time_to_seconds(self.start_time.get())
+            end_seconds = self.time_to_seconds(self.end_time.get())
+            settings.duration = end_seconds - settings.start_seconds
+            settings.total_duration = settings.duration
+        else:
+            settings.total_duration = max(self.video_duration, 0.0)
+        settings.audio_index = self.audio_streams[0].index if self.audio_streams else 0
+        if codec is not None:
+            settings.codec = codec
+            self._collect_advanced_settings(settings)
+        if self.audio_streams:
+            settings.audio_map = (
+                self.audio_indices.index(settings.audio_index)
+                if settings.audio_index in self.audio_indices
+                else 0
+            )
+        return settings
+
+    def _collect_advanced_settings(self, settings: EncodeSettings) -> None:
+        """Fill in the Advanced section's options other than the codec."""
+        settings.crf = self.selected_crf.get()
+        settings.fps = self.selected_fps.get()
+        settings.audio_bitrate = self.selected_audio_bitrate.get()
+        res_label = self.selected_resolution.get()
+        settings.resolution = RESOLUTION_LABEL_TO_VALUE.get(
+            res_label, res_label.replace("x", ":")
+        )
+        settings.preset = self.selected_preset.get()
+        speed_label = self.selected_speed.get()
+        if not speed_label.startswith("1.0"):
+            settings.speed = float(speed_label.split("x")[0])
+        settings.container = self.selected_container.get().lower()
+        settings.target_size = self.target_size_mb.get().strip()
+        settings.tune = TUNE_LABEL_TO_VALUE.get(self.selected_tune.get(), "")
+        if (
+            self.include_tracks.get()
+            and self.subtitle_combobox
+            and self.subtitle_combobox.winfo_ismapped()
+        ):
+            idx = self.subtitle_combobox.current()
+            if idx > 0 and idx <= len(self.subtitle_streams):
+                settings.subtitle = self.subtitle_streams[idx - 1]
+        if (
+            self.include_tracks.get()
+            and self.audio_combobox
+            and self.audio_combobox.winfo_ismapped()
+        ):
+            idx = self.audio_combobox.current()
+            if idx >= 0 and idx < len(self.audio_streams):
+                settings.audio_index = self.audio_streams[idx].index
+
+    def get_input_info(self, path):
+        """Return (width, height, fps) of the first video stream, or Nones."""
+        video_streams = probed_streams(probe_media(path), "video")
         try:
-            input_path = self.input_file.get()
-            trimming = self.trim_enabled.get()
-            if self.video_duration <= 0:
-                self.get_video_duration(input_path)
-            if self.advanced_enabled.get():
-                codec_label = self.selected_codec.get()
-                codec = dict(VIDEO_CODECS)[codec_label]
-                crf = self.selected_crf.get()
-                fps = self.selected_fps.get()
-                audio_bitrate = self.selected_audio_bitrate.get()
-                res_label = self.selected_resolution.get()
-                preset_res_dict = dict(RESOLUTION_OPTIONS)
-                if res_label in preset_res_dict:
-                    resolution = preset_res_dict[res_label]
-                else:
-                    resolution = res_label.replace("x", ":")
-                preset = self.selected_preset.get()
-                speed_label = self.selected_speed.get()
-                speed_value = 1.0
-                if speed_label.startswith("1.0"):
-                    speed_value = 1.0
-                else:
-                    speed_value = float(speed_label.split("x")[0])
-                container_label = self.selected_container.get().lower()
+            stream = video_streams[0]
+            width = int(stream["width"])
+            height = int(stream["height"])
+        except (IndexError, KeyError, ValueError):
+            return None, None, None
+        fps_val = parse_frame_rate(stream.get("r_frame_rate", ""))
+        if fps_val is None:
+            return None, None, None
+        return width, height, fps_val
+
+    def build_ffmpeg_command(
+        self, settings: EncodeSettings, input_info, video_kbps: Optional[int]
+    ) -> FFmpegCommandBuilder:
+        """
+        Assemble the FFmpeg command for a run, apart from the output path.
+
+        Args:
+            settings: Snapshot of the UI options
+            input_info: (width, height, fps) of the input, or Nones if unknown
+            video_kbps: Video bitrate for a target-size encode, else None
+        """
+        input_path = settings.input_path
+        trimming = settings.trimming
+        start_seconds = settings.start_seconds
+        duration = settings.duration
+        codec = settings.codec
+        resolution = settings.resolution
+        fps = settings.fps
+        speed_value = settings.speed
+        selected_subtitle = settings.subtitle
+        input_w, input_h, input_fps = input_info
+        builder = FFmpegCommandBuilder()
+        use_copy = (
+            not settings.advanced
+            and input_w is not None
+            and input_h is not None
+            and input_fps is not None
+        )
+        if use_copy:
+            if trimming:
+                # Input seek + stream copy: no re-encode, cuts land on keyframes
+                builder.with_extra(["-fflags", "+genpts"])
+                builder.with_hybrid_trim(start_seconds, duration)
+                builder.with_input(input_path)
+                builder.with_extra(["-t", str(duration)])
+                builder.with_extra(["-avoid_negative_ts", "make_zero"])
             else:
-                codec = "libx264"
-                crf = "20"
-                fps = "120"
-                audio_bitrate = "128k"
-                resolution = "1920:1080"
-                preset = "medium"
-                speed_value = 1.0
-                container_label = "mp4"
-
-            def get_input_info(path):
-                try:
-                    cmd = [
-                        "ffprobe",
-                        "-v",
-                        "error",
-                        "-select_streams",
-                        "v:0",
-                        "-show_entries",
-                        "stream=width,height,r_frame_rate",
-                        "-of",
-                        "json",
-                        path,
+                builder.with_input(input_path)
+            builder.with_extra(["-c:v", "copy", "-c:a", "copy"])
+            return builder
+        if trimming:
+            builder.with_extra(["-fflags", "+genpts"])
+            builder.with_hybrid_trim(start_seconds, duration)
+            builder.with_input(input_path)
+            builder.with_post_input_trim(0, duration)
+        else:
+            builder.with_input(input_path)
+        if selected_subtitle is not None:
+            if settings.container in ("mp4", "webm"):
+                sub_path = self.escape_subtitles_path(input_path)
+                si_opt = f":si={selected_subtitle.map_index}"
+                builder.with_subtitles(sub_path, si_opt)
+                builder.with_video_settings(resolution, fps)
+                builder.with_speed(speed_value)
+                builder.with_extra(["-sn"])
+            elif settings.container == "mkv":
+                builder.with_video_settings(resolution, fps)
+                builder.with_speed(speed_value)
+                builder.with_extra(
+                    [
+                        "-map",
+                        f"0:s:{selected_subtitle.map_index}",
+                        "-c:s",
+                        "copy",
                     ]
-                    result = subprocess.run(
-                        cmd, capture_output=True, text=True, check=True
-                    )
-                    data = json.loads(result.stdout)
-                    stream = data["streams"][0]
-                    width = int(stream["width"])
-                    height = int(stream["height"])
-                    fps_val = eval(stream["r_frame_rate"])
-                    return width, height, fps_val
+                )
+        else:
+            scale_needed = True
+            fps_needed = True
+            if input_w and input_h and resolution:
+                try:
+                    w, h = map(int, resolution.split(":"))
+                    if w == input_w and h == input_h:
+                        scale_needed = False
                 except Exception:
-                    return None, None, None
-
-            input_w, input_h, input_fps = get_input_info(input_path)
-            if self.advanced_enabled.get():
-                selected_subtitle = None
-                if (
-                    self.include_tracks.get()
-                    and self.subtitle_combobox
-                    and self.subtitle_combobox.winfo_ismapped()
-                ):
-                    idx = self.subtitle_combobox.current()
-                    if idx > 0 and idx <= len(self.subtitle_streams):
-                        selected_subtitle = self.subtitle_streams[idx - 1]
-                if (
-                    self.include_tracks.get()
-                    and self.audio_combobox
-                    and self.audio_combobox.winfo_ismapped()
-                ):
-                    idx = self.audio_combobox.current()
-                    if idx >= 0 and idx < len(self.audio_streams):
-                        selected_audio_index = self.audio_streams[idx].index
-                    else:
-                        selected_audio_index = (
-                            self.audio_streams[0].index if self.audio_streams else 0
-                        )
-                else:
-                    selected_audio_index = (
-                        self.audio_streams[0].index if self.audio_streams else 0
-                    )
-            else:
-                selected_subtitle = None
-                selected_audio_index = (
-                    self.audio_streams[0].index if self.audio_streams else 0
+                    pass
+            if input_fps and fps:
+                try:
+                    if float(fps) == float(input_fps):
+                        fps_needed = False
+                except Exception:
+                    pass
+            if scale_needed or fps_needed:
+                builder.with_video_settings(
+                    resolution if scale_needed else None,
+                    fps if fps_needed else None,
                 )
-            builder = FFmpegCommandBuilder()
-            use_copy = (
-                not self.advanced_enabled.get()
-                and not trimming
-                and input_w is not None
-                and input_h is not None
-                and input_fps is not None
-            )
-            if use_copy:
-                builder.with_input(input_path)
-                builder.with_extra(["-c:v", "copy", "-c:a", "copy"])
-            else:
-                if trimming:
-                    start_seconds = self.time_to_seconds(self.start_time.get())
-                    duration = self.time_to_seconds(self.end_time.get()) - start_seconds
-                    builder.with_hybrid_trim(start_seconds, duration)
-                    builder.with_input(input_path)
-                    builder.with_post_input_trim(0, duration)
-                else:
-                    builder.with_input(input_path)
-                if selected_subtitle is not None:
-                    if container_label in ("mp4", "webm"):
-                        sub_path = self.escape_subtitles_path(input_path)
-                        si_opt = f":si={selected_subtitle.map_index}"
-                        builder.with_subtitles(sub_path, si_opt)
-                        builder.with_video_settings(resolution, fps)
-                        builder.with_speed(speed_value)
-                        builder.with_extra(["-sn"])
-                    elif container_label == "mkv":
-                        builder.with_video_settings(resolution, fps)
-                        builder.with_speed(speed_value)
-                        builder.with_extra(
-                            [
-                                "-map",
-                                f"0:s:{selected_subtitle.map_index}",
-                                "-c:s",
-                                "copy",
-                            ]
-                        )
-                else:
-                    scale_needed = True
-                    fps_needed = True
-                    if input_w and input_h and resolution:
-                        try:
-                            w, h = map(int, resolution.split(":"))
-                            if w == input_w and h == input_h:
-                                scale_needed = False
-                        except Exception:
-                            pass
-                    if input_fps and fps:
-                        try:
-                            if float(fps) == float(input_fps):
-                                fps_needed = False
-                        except Exception:
-                            pass
-                    if scale_needed or fps_needed:
-                        builder.with_video_settings(
-                            resolution if scale_needed else None,
-                            fps if fps_needed else None,
-                        )
-                    builder.with_speed(speed_value)
-                    builder.with_extra(["-sn"])
-                map_args = ["-map", "0:v"]
-                if self.audio_streams:
-                    audio_idx = (
-                        self.audio_indices.index(selected_audio_index)
-                        if selected_audio_index in self.audio_indices
-                        else 0
-                    )
-                    map_args.extend(["-map", f"0:a:{audio_idx}"])
-                builder.with_map(map_args)
-                builder.with_codec(codec, crf, preset)
-                if audio_bitrate == "Remove Audio":
-                    builder.with_extra(["-an"])
-                else:
-                    builder.with_audio(
-                        "libopus" if codec == "libvpx-vp9" else "aac", audio_bitrate
-                    )
-            command = builder.build(output_path)
-            # Actually run the FFmpeg process and handle errors
-            import re
-
-            process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
+            builder.with_speed(speed_value)
+            builder.with_extra(["-sn"])
+        map_args = ["-map", "0:v"]
+        if settings.audio_map is not None:
+            map_args.extend(["-map", f"0:a:{settings.audio_map}"])
+        builder.with_map(map_args)
+        if video_kbps is not None:
+            builder.with_bitrate(codec, video_kbps, settings.preset)
+        else:
+            builder.with_codec(codec, settings.crf, settings.preset)
+        builder.with_tune(codec, settings.tune)
+        if (
+            codec == "libx264"
+            and 0 < settings.total_duration / speed_value <= SLICED_THREADS_MAX_SECONDS
+        ):
+            # Frame threads spend most of a short clip filling their pipeline
+            builder.with_extra(["-x264-params", "sliced-threads=1"])
+        if settings.audio_bitrate == "Remove Audio":
+            builder.with_extra(["-an"])
+        else:
+            builder.with_audio(
+                CODEC_AUDIO_ENCODERS.get(codec, DEFAULT_AUDIO_ENCODER),
+                settings.audio_bitrate,
             )
-            self.ffmpeg_process = process
-            time_pattern = re.compile(r"time=(\d+):(\d+):(\d+\.\d+)")
-            last_percent = 0
-            ffmpeg_stderr = []
-            total_duration = duration if trimming else self.video_duration
+        return builder
+
+    def run_ffmpeg_with_progress(self, settings: EncodeSettings, output_path):
+        try:
+            if settings.total_duration <= 0 and not settings.trimming:
+                # The pick-time probe failed; try again without touching Tk state
+                settings.total_duration = self.get_video_duration(settings.input_path)
+            total_duration = settings.total_duration
             if total_duration <= 0:
                 total_duration = 1
-            # Read stderr lines as they come, but also collect all output for error analysis
-            while True:
-                if getattr(self, "cancel_requested", False):
-                    try:
-                        process.terminate()
-                    except Exception:
-                        pass
+            video_kbps = None
+            if settings.target_size:
+                video_kbps = self.target_video_bitrate(
+                    float(settings.target_size),
+                    total_duration / settings.speed,
+                    settings.audio_bitrate,
+                )
+                if video_kbps is None:
                     self.root.after(
                         0,
                         self.processing_complete,
                         False,
-                        "Processing cancelled by user.",
+                        "Target size is too small for this clip's length.",
                     )
                     return
-                line = process.stderr.readline()
-                if not line:
-                    break
-                ffmpeg_stderr.append(line)
-                match = time_pattern.search(line)
-                if match:
-                    h, m, s = match.groups()
-                    current = int(h) * 3600 + int(m) * 60 + float(s)
-                    percent = int((current / total_duration) * 100)
-                    percent = min(percent, 100)
-                    if percent != last_percent:
-                        last_percent = percent
-                        self.root.after(0, self.progress_bar.config, {"value": percent})
-            # After process ends, read any remaining stderr output (in case of buffer)
-            remaining = process.stderr.read()
-            if remaining:
-                ffmpeg_stderr.extend(remaining.splitlines())
-            process.wait()
+            input_info = self.get_input_info(settings.input_path)
+            builder = self.build_ffmpeg_command(settings, input_info, video_kbps)
+            if output_path.lower().endswith(".mp4"):
+                # Put the moov index up front so uploads play before fully loading
+                builder.with_extra(["-movflags", "+faststart"])
+            if video_kbps is not None:
+                # Pass 1 and pass 2 each fill half of the progress bar
+                passlog_dir = tempfile.mkdtemp(prefix="clipper-")
+                try:
+                    first, second = builder.build_two_pass(settings.codec, output_path)
+                    result = self._run_ffmpeg_pass(
+                        first, total_duration, 0, 50, passlog_dir
+                    )
+                    if result is not None and result[0] == 0:
+                        result = self._run_ffmpeg_pass(
+                            second, total_duration, 50, 50, passlog_dir
+                        )
+                finally:
+                    shutil.rmtree(passlog_dir, ignore_errors=True)
+            else:
+                command = builder.build(output_path)
+                result = self._run_ffmpeg_pass(command, total_duration, 0, 100)
+            if result is None:
+                return
+            returncode, ffmpeg_stderr = result
             # Now check for errors as soon as process ends
-            if process.returncode == 0:
+            if returncode == 0:
                 self.root.after(
                     0,
                     self.processing_complete,
@@ -1950,7 +2775,7 @@ class ClipperGUI:
                     0,
                     self.processing_complete,
                     False,
-                    f"FFmpeg processing failed (exit code: {process.returncode}).\n\nError details:\n{error_output}",
+                    f"FFmpeg processing failed (exit code: {returncode}).\n\nError details:\n{error_output}",
                 )
         except FileNotFoundError:
             error_msg = "FFmpeg not found! Please make sure FFmpeg is installed and available in your system PATH."
@@ -1967,6 +2792,98 @@ class ClipperGUI:
             error_msg = f"Unexpected error during processing: {str(e)}"
             self.root.after(0, self.processing_complete, False, error_msg)
 
+    def _run_ffmpeg_pass(
+        self, command, total_duration, progress_start, progress_span, cwd=None
+    ):
+        """
+        Run one FFmpeg invocation, mapping its progress onto a slice of the bar.
+        Returns:
+            Tuple of (exit code, last stderr lines), or None if the user cancelled
+        """
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=cwd,
+        )
+        self.ffmpeg_process = process
+        last_percent = progress_start
+        # Drain stderr on its own thread so a chatty encode can't fill the pipe
+        # and stall while progress is read from stdout
+        ffmpeg_stderr = deque(maxlen=FFMPEG_STDERR_MAX_LINES)
+        stderr_reader = threading.Thread(
+            target=ffmpeg_stderr.extend, args=(process.stderr,), daemon=True
+        )
+        stderr_reader.start()
+        for line in process.stdout:
+            if getattr(self, "cancel_requested", False):
+                try:
+                    process.terminate()
+                except Exception:
+                    pass
+                break
+            # Pipes are read as bytes; only the progress value gets parsed
+            if not line.startswith(FFMPEG_PROGRESS_TIME_KEY):
+                continue
+            try:
+                current = int(line[len(FFMPEG_PROGRESS_TIME_KEY) :]) / 1_000_000
+            except ValueError:
+                continue  # "N/A" before the first frame is written
+            fraction = min(max(current, 0) / total_duration, 1.0)
+            percent = progress_start + int(fraction * progress_span)
+            if percent != last_percent:
+                last_percent = percent
+                self._post_progress(percent)
+        stderr_reader.join()
+        process.wait()
+        # cancel_processing may terminate FFmpeg first, which just ends stdout,
+        # so the non-zero exit code must not be reported as a failure
+        if getattr(self, "cancel_requested", False):
+            self.root.after(
+                0,
+                self.processing_complete,
+                False,
+                "Processing cancelled by user.",
+            )
+            return None
+        return process.returncode, [
+            line.decode("utf-8", "replace") for line in ffmpeg_stderr
+        ]
+
+    def _post_progress(self, percent):
+        """Queue a progress bar update, merging it with one already queued."""
+        with self._progress_lock:
+            already_queued = self._pending_progress is not None
+            self._pending_progress = percent
+        if not already_queued:
+            self.root.after(0, self._flush_progress)
+
+    def _flush_progress(self):
+        with self._progress_lock:
+            percent, self._pending_progress = self._pending_progress, None
+        if percent is not None:
+            self.progress_bar["value"] = percent
+
+    @staticmethod
+    def target_video_bitrate(
+        size_mb: float, seconds: float, audio_bitrate: str
+    ) -> Optional[int]:
+        """
+        Work out the video bitrate that makes the output land on a target size.
+        Args:
+            size_mb: Desired output size in megabytes
+            seconds: Output duration in seconds
+            audio_bitrate: Audio bitrate option such as "128k" or "Remove Audio"
+        Returns:
+            Video bitrate in kbit/s, or None if the audio alone would not fit
+        """
+        total_kbps = size_mb * 8192 / max(seconds, 1)
+        if audio_bitrate != "Remove Audio":
+            total_kbps -= int(audio_bitrate[:-1])
+        if total_kbps < MIN_VIDEO_BITRATE_KBPS:
+            return None
+        return int(total_kbps)
+
     def cancel_processing(self):
         if not self.is_processing:
             return
@@ -1991,6 +2908,18 @@ class ClipperGUI:
 
         self.root.update()
 
+    def on_close(self) -> None:
+        """Stop any running encode, then close; daemon workers end with the app."""
+        self.cancel_requested = True
+        self._closing = True
+        if self.ffmpeg_process and self.ffmpeg_process.poll() is None:
+            try:
+                self.ffmpeg_process.kill()
+            except Exception:
+                pass  # Process already exited
+        WORKER_POOL.shutdown(wait=False)
+        self.root.destroy()
+
     def reset_settings(self):
         if messagebox.askyesno("Reset", "Are you sure you want to reset all fields?"):
             self.input_file.set("")
@@ -1998,6 +2927,7 @@ class ClipperGUI:
             self.end_time.set("0:00")
             self.trim_enabled.set(False)
             self.save_as_enabled.set(False)
+            self._pending_var_updates.clear()
             self.custom_output_name.set("")
             self.selected_preset.set("medium")
             self.advanced_enabled.set(False)
@@ -2008,6 +2938,8 @@ class ClipperGUI:
             self.selected_resolution.set("1920x1080")
             self.selected_container.set("mp4")
             self.selected_speed.set("1.0x (Normal)")
+            self.target_size_mb.set("")
+            self.selected_tune.set("Auto")
             self.file_info_label.config(text="No file selected", style="Info.TLabel")
             self.status_label.config(text="Ready to process video", style="Info.TLabel")
             self.progress_bar["value"] = 0
@@ -2019,9 +2951,11 @@ class ClipperGUI:
             self.reset_btn.config(state="normal")
             self.timeline_frame.grid_remove()
             self.advanced_frame.grid_remove()
+            self.update_fast_trim_hint()
             self.upload_frame.grid_remove()
             self.track_selection_frame.grid_remove()
             self.last_output_path = None
+            self._output_size_bytes = None
             self.open_file_btn.grid_remove()
             self.show_in_explorer_btn.grid_remove()
 
@@ -2039,8 +2973,16 @@ class ClipperGUI:
         self.progress_bar["value"] = 100 if success else 0
         self.progress_bar.pack_forget()
         self.set_processing_ui_state(False)
+        self._size_warning_shown = False
+        try:
+            self._output_size_bytes = (
+                os.path.getsize(self.last_output_path) if success else None
+            )
+        except OSError:
+            self._output_size_bytes = None
         if success:
             self.status_label.config(text="✅ " + message, style="Success.TLabel")
+            self.check_upload_size_limit()
             messagebox.showinfo("Success", message)
             self.upload_frame.grid()
             self.open_file_btn.grid()
@@ -2064,6 +3006,8 @@ class ClipperGUI:
                 self.audio_bitrate_menu.config(state="normal")
                 self.resolution_menu.config(state="normal")
                 self.container_menu.config(state="normal")
+                self.target_size_entry.config(state="normal")
+                self.tune_menu.config(state="readonly")
                 # Enable speed_menu
                 if hasattr(self, "speed_menu"):
                     self.speed_menu.config(state="normal")
@@ -2076,154 +3020,126 @@ class ClipperGUI:
                     self.audio_combobox.config(state="normal")
         else:
             self.advanced_frame.grid_remove()
+        self.update_fast_trim_hint()
+        # One idle-task flush settles the new layout; geometry("") then lets
+        # the window shrink or grow to fit it
         self.root.update_idletasks()
         self.root.geometry("")
-        self.root.update()
+
+    def update_fast_trim_hint(self):
+        """Show the stream-copy hint only when trims skip re-encoding."""
+        if self.advanced_enabled.get():
+            self.fast_trim_label.grid_remove()
+        else:
+            self.fast_trim_label.grid()
+
+    def check_upload_size_limit(self, *args):
+        """Warn as soon as the output is too big for the selected service."""
+        if self._output_size_bytes is None:
+            return
+        service = get_upload_service_by_key(self.upload_service.get())
+        if service and self._output_size_bytes > service.max_size_mb * 1024 * 1024:
+            size_mb = self._output_size_bytes / (1024 * 1024)
+            self.status_label.config(
+                text=f"⚠ {size_mb:.1f} MB exceeds the {service.name} limit "
+                f"({service.max_size_mb} MB)",
+                style="Error.TLabel",
+            )
+            self._size_warning_shown = True
+        elif self._size_warning_shown:
+            self.status_label.config(text="Ready to upload", style="Info.TLabel")
+            self._size_warning_shown = False
 
     def upload_to_selected_service(self):
         selected_key = self.upload_service.get()
         if not self.last_output_path or not os.path.exists(self.last_output_path):
             messagebox.showerror("Error", "No processed video file found!")
             return
-        # Validate file size before upload
-        if not self.validate_file_size_for_upload(self.last_output_path, selected_key):
+        # Validate file size before upload; the size is reused for the request
+        file_size = self.validate_file_size_for_upload(
+            self.last_output_path, selected_key
+        )
+        if file_size is None:
             return
         self.upload_btn.config(state="disabled", text="Uploading...")
         self.status_label.config(text="Uploading...", style="Info.TLabel")
-        thread = threading.Thread(
-            target=self._upload_file, args=(self.last_output_path, selected_key)
+        WORKER_POOL.submit(
+            self._upload_file, self.last_output_path, selected_key, file_size
         )
-        thread.daemon = True
-        thread.start()
 
-    def _upload_file(self, file_path, service):
+    def _upload_file(self, file_path, service, file_size=None):
         try:
-            if service == "catbox":
-                result_url = self._upload_to_catbox(file_path)
-            elif service == "uguu":
-                result_url = self._upload_to_uguu(file_path)
-            elif service == "tempsh":
-                result_url = self._upload_to_tempsh(file_path)
-            else:
+            service_info = get_upload_service_by_key(service)
+            if service_info is None:
                 raise Exception("Unknown upload service")
-            self.root.after(0, self._upload_success, result_url)
+            result_url = self._upload_multipart(file_path, service_info, file_size)
+            self.root.after(0, self._upload_success, result_url, service_info)
         except Exception as e:
             self.root.after(0, self._upload_error, f"Upload error: {str(e)}")
 
-    def _upload_to_catbox(self, file_path):
-        url = "https://catbox.moe/user/api.php"
-
-        # Prepare the multipart form data
-        boundary = f"----WebKitFormBoundary{int(time.time() * 1000)}"
-
-        with open(file_path, "rb") as f:
-            file_data = f.read()
-
-        # Build multipart form data
-        data = []
-        data.append(f"--{boundary}".encode())
-        data.append(b'Content-Disposition: form-data; name="reqtype"')
-        data.append(b"")
-        data.append(b"fileupload")
-
-        data.append(f"--{boundary}".encode())
-        data.append(
-            f'Content-Disposition: form-data; name="fileToUpload"; filename="{os.path.basename(file_path)}"'.encode()
-        )
-        data.append(b"Content-Type: video/mp4")
-        data.append(b"")
-        data.append(file_data)
-
-        data.append(f"--{boundary}--".encode())
-        data.append(b"")
-
-        body = b"\r\n".join(data)
-
-        # Create request
-        req = urllib.request.Request(url, data=body)
-        req.add_header("Content-Type", f"multipart/form-data; boundary={boundary}")
-        req.add_header("Content-Length", str(len(body)))
-
-        # Upload file
-        with urllib.request.urlopen(req, timeout=600) as response:
-            result_url = response.read().decode("utf-8").strip()
-
-            if result_url.startswith("http"):
-                return result_url
-            else:
-                raise Exception(f"Upload failed: {result_url}")
-
-    def _upload_to_uguu(self, file_path):
-        url = "https://uguu.se/upload"
-
-        # Prepare the multipart form data
-        boundary = f"----WebKitFormBoundary{int(time.time() * 1000)}"
-
-        with open(file_path, "rb") as f:
-            file_data = f.read()
-
-        # Build multipart form data for uguu.se
-        data = []
-        data.append(f"--{boundary}".encode())
-        data.append(
-            f'Content-Disposition: form-data; name="files[]"; filename="{os.path.basename(file_path)}"'.encode()
+    def _upload_progress(self, percent):
+        """Report streaming upload progress; runs on the upload worker."""
+        if self._closing:
+            # Abandon the transfer so the worker can finish and the app exit
+            raise Exception("Upload aborted")
+        self.root.after(
+            0, self.status_label.config, {"text": f"Uploading... {percent}%"}
         )
-        data.append(b"Content-Type: video/mp4")
-        data.append(b"")
-        data.append(file_data)
-        data.append(f"--{boundary}--".encode())
-        data.append(b"")
 
-        body = b"\r\n".join(data)
+    def _upload_multipart(
+        self, file_path, service: UploadService, file_size: Optional[int] = None
+    ) -> str:
+        """
+        Upload a file to a service described in UPLOAD_SERVICES.
 
-        # Create request
-        req = urllib.request.Request(url, data=body)
-        req.add_header("Content-Type", f"multipart/form-data; boundary={boundary}")
-        req.add_header("Content-Length", str(len(body)))
+        Args:
+            file_path: Path of the file to upload
+            service: Service to upload to
+            file_size: Size of the file if already known, to skip a stat
 
-        # Upload file
-        with urllib.request.urlopen(req, timeout=60) as response:
-            result = json.loads(response.read().decode("utf-8"))
+        Returns:
+            The public URL of the uploaded file
 
-            if "files" in result and len(result["files"]) > 0:
-                return result["files"][0]["url"]
-            else:
-                raise Exception("Upload failed: Invalid response from uguu.se")
-
-    def _upload_to_tempsh(self, file_path):
-        url = "https://temp.sh/upload"
-        boundary = f"----WebKitFormBoundary{int(time.time() * 1000)}"
-        with open(file_path, "rb") as f:
-            file_data = f.read()
-        data = []
-        data.append(f"--{boundary}".encode())
-        data.append(
-            f'Content-Disposition: form-data; name="file"; filename="{os.path.basename(file_path)}"'.encode()
-        )
-        data.append(b"Content-Type: video/mp4")
-        data.append(b"")
-        data.append(file_data)
-        data.append(f"--{boundary}--".encode())
-        data.append(b"")
-        body = b"\r\n".join(data)
-        req = urllib.request.Request(url, data=body)
-        req.add_header("Content-Type", f"multipart/form-data; boundary={boundary}")
-        req.add_header("Content-Length", str(len(body)))
-        with urllib.request.urlopen(req, timeout=60) as response:
-            result_url = response.read().decode("utf-8").strip()
-            if result_url.startswith("http"):
-                return result_url
-            else:
-                raise Exception(f"Upload failed: {result_url}")
+        Raises:
+            Exception: If the service doesn't answer with a URL
+        """
+        fields = {"reqtype": service.reqtype} if service.reqtype else None
+        body = MultipartFileBody(
+            file_path,
+            service.field_name,
+            fields=fields,
+            progress=self._upload_progress,
+            file_size=file_size,
+        )
+        response = https_post(
+            service.url, body, body.headers(), timeout=service.timeout
+        )
+        if service.json_response:
+            try:
+                # json.loads detects the encoding of bytes itself
+                return json.loads(response)["files"][0]["url"]
+            except (ValueError, KeyError, IndexError, TypeError):
+                raise Exception(f"Upload failed: Invalid response from {service.name}")
+        result_url = response.strip().decode("utf-8", "replace")
+        if result_url.startswith("http"):
+            return result_url
+        raise Exception(f"Upload failed: {result_url}")
+
+    def _upload_success(self, url, service: UploadService):
+        """
+        Show a finished upload's URL.
 
-    def _upload_success(self, url):
-        service = self.upload_service.get()
-        service_info = self.get_upload_service_info(service)
+        Args:
+            url: Public URL returned by the service
+            service: The service the file went to, which may no longer be
+                the selected one if the user switched during the upload
+        """
+        expiration = service.expiration
 
         # Create success message with expiration info
-        success_msg = f"✅ Uploaded to {service}"
-        if service_info and getattr(service_info, "expiration", None):
-            success_msg += f" (expires: {service_info.expiration})"
+        success_msg = f"✅ Uploaded to {service.key}"
+        if expiration:
+            success_msg += f" (expires: {expiration})"
 
         self.upload_btn.config(state="normal", text="Upload")
         self.status_label.config(text=success_msg, style="Success.TLabel")
@@ -2235,18 +3151,14 @@ class ClipperGUI:
             try:
                 self.root.clipboard_clear()
                 self.root.clipboard_append(url)
-                self.copy_url_btn.config(text="✅ Copied")
-                self.root.after(2000, lambda: self.copy_url_btn.config(text="Copy"))
+                self._show_copied_feedback()
             except Exception:
                 pass
 
         # Show success alert
-        service_name = (
-            getattr(service_info, "name", service) if service_info else service
-        )
-        alert_msg = f"Video uploaded successfully to {service_name}!\n\nURL: {url}"
-        if service_info and getattr(service_info, "expiration", None):
-            alert_msg += f"\n\nNote: This file will expire in {service_info.expiration}"
+        alert_msg = f"Video uploaded successfully to {service.name}!\n\nURL: {url}"
+        if expiration:
+            alert_msg += f"\n\nNote: This file will expire in {expiration}"
         messagebox.showinfo("Upload Success", alert_msg)
 
         # Update window size to accommodate new content
@@ -2260,14 +3172,24 @@ class ClipperGUI:
         self.upload_url.set("")
         self.url_row.grid_remove()
 
+    def _show_copied_feedback(self):
+        """Label the copy button "Copied" for two seconds after the last copy."""
+        self.copy_url_btn.config(text="✅ Copied")
+        if self._copy_reset_job is not None:
+            self.root.after_cancel(self._copy_reset_job)
+        self._copy_reset_job = self.root.after(2000, self._reset_copy_button)
+
+    def _reset_copy_button(self):
+        self._copy_reset_job = None
+        self.copy_url_btn.config(text="Copy")
+
     def copy_upload_url(self):
         url = self.upload_url.get()
         if url:
             try:
                 self.root.clipboard_clear()
                 self.root.clipboard_append(url)
-                self.copy_url_btn.config(text="✅ Copied")
-                self.root.after(2000, lambda: self.copy_url_btn.config(text="Copy"))
+                self._show_copied_feedback()
             except Exception:
                 messagebox.showerror("Copy Error", "Failed to copy URL to clipboard.")
 
@@ -2276,42 +3198,54 @@ class ClipperGUI:
             messagebox.showerror("Error", "No output file to open.")
             return
         path = os.path.abspath(self.last_output_path)
-        try:
+
+        def _launch():
             if os.name == "nt":
                 os.startfile(os.path.normpath(path))
             elif os.name == "posix":
-                import sys
-                import subprocess
-
                 if sys.platform == "darwin":
                     subprocess.run(["open", path])
                 else:
                     subprocess.run(["xdg-open", path])
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not open file: {e}")
+
+        self._run_shell_launch(_launch, "Could not open file")
 
     def show_in_file_explorer(self):
         if not self.last_output_path or not os.path.exists(self.last_output_path):
             messagebox.showerror("Error", "No output file to show.")
             return
         path = os.path.abspath(self.last_output_path)
-        try:
+
+        def _launch():
             if os.name == "nt":
                 # Windows: open folder and select file
-                import subprocess
-
                 subprocess.run(["explorer", "/select,", os.path.normpath(path)])
             elif os.name == "posix":
                 # macOS or Linux
-                import sys
-                import subprocess
-
                 if sys.platform == "darwin":
                     subprocess.run(["open", "-R", path])
                 else:
                     subprocess.run(["xdg-open", os.path.dirname(path)])
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not open file explorer: {e}")
+
+        self._run_shell_launch(_launch, "Could not open file explorer")
+
+    def _run_shell_launch(self, launch: Callable[[], None], error_prefix: str):
+        """
+        Run a file-manager or default-app launch on the worker pool.
+
+        Explorer and xdg-open can take a noticeable moment to start, so the
+        Tk thread doesn't wait for them; failures are reported back on it.
+        """
+
+        def _run():
+            try:
+                launch()
+            except Exception as e:
+                self.root.after(
+                    0, messagebox.showerror, "Error", f"{error_prefix}: {e}"
+                )
+
+        WORKER_POOL.submit(_run)
 
     def open_upload_url_in_browser(self):
         url = self.upload_url.get()
@@ -2320,17 +3254,36 @@ class ClipperGUI:
 
             webbrowser.open(url)
 
+    def get_container_extension(self) -> str:
+        """Return the output file extension for the selected container."""
+        return CONTAINER_EXTENSIONS.get(self.selected_container.get(), ".mp4")
+
+    def retarget_output_extension(self) -> None:
+        """Point the output filename at the selected container's extension."""
+        self.flush_var_updates()  # Work from the latest queued name
+        name = self.custom_output_name.get()
+        if not name:
+            return
+        new_name = retarget_extension(name, self.get_container_extension())
+        if new_name != name:
+            self.set_var_deferred(self.custom_output_name, new_name)
+
+    def _detect_hardware_codecs_bg(self) -> None:
+        # Also warms the version cache checked before every encode
+        if get_ffmpeg_version() is None:
+            return
+        encoders = detect_hardware_encoders()
+        if encoders:
+            self.root.after(0, self._add_hardware_codecs, encoders)
+
+    def _add_hardware_codecs(self, encoders: List[str]) -> None:
+        """List the detected hardware encoders after the software codecs."""
+        labels = [label for label, val in HARDWARE_VIDEO_CODECS if val in encoders]
+        self.codec_menu["values"] = VIDEO_CODEC_LABELS + tuple(labels)
+
     def on_codec_changed(self, event=None):
         # Update extension based on container, not codec
-        name = self.custom_output_name.get()
-        container_label = self.selected_container.get()
-        ext = ".mp4"
-        for label, val in CONTAINER_FORMATS:
-            if label == container_label:
-                ext = f".{val}"
-        if not name.endswith(ext):
-            name_path = Path(name)
-            self.custom_output_name.set(str(name_path.with_suffix(ext)))
+        self.retarget_output_extension()
 
     def toggle_track_selection(self):
         if self.include_tracks.get():
@@ -2388,6 +3341,7 @@ class ClipperGUI:
 
     def on_container_changed(self, event=None):
         """Handle container format changes to update track selection UI."""
+        self.retarget_output_extension()
         # Re-setup the track selection UI with the new container format
         if hasattr(self, "subtitle_streams") and hasattr(self, "audio_streams"):
             self.setup_track_selection_ui(self.subtitle_streams, self.audio_streams)
@@ -2399,22 +3353,11 @@ class ClipperGUI:
         Returns:
             True if FFmpeg is available, False otherwise
         """
-        try:
-            subprocess.run(
-                ["ffmpeg", "-version"],
-                capture_output=True,
-                check=True,
-                timeout=FFMPEG_VERSION_TIMEOUT,
-            )
-            return True
-        except (
-            subprocess.TimeoutExpired,
-            subprocess.CalledProcessError,
-            FileNotFoundError,
-        ):
-            return False
+        return get_ffmpeg_version() is not None
 
-    def validate_file_size_for_upload(self, file_path: str, service: str) -> bool:
+    def validate_file_size_for_upload(
+        self, file_path: str, service: str
+    ) -> Optional[int]:
         """
         Validate that the file size is within the upload service's limits.
 
@@ -2423,7 +3366,7 @@ class ClipperGUI:
             service: Upload service key (catbox, uguu, tempsh)
 
         Returns:
-            True if file size is acceptable, False otherwise
+            The file size in bytes if it is acceptable, None otherwise
         """
         try:
             file_size_bytes = os.path.getsize(file_path)
@@ -2431,7 +3374,7 @@ class ClipperGUI:
             service_config = get_upload_service_by_key(service)
             if not service_config:
                 messagebox.showerror("Error", f"Unknown upload service: {service}")
-                return False
+                return None
             max_size_mb = service_config.max_size_mb
             service_name = service_config.name
             if file_size_mb > max_size_mb:
@@ -2440,11 +3383,11 @@ class ClipperGUI:
                     f"File size ({file_size_mb:.1f} MB) exceeds the limit for {service_name} ({max_size_mb} MB).\n\n"
                     f"Please choose a different upload service or reduce the file size.",
                 )
-                return False
-            return True
+                return None
+            return file_size_bytes
         except (OSError, FileNotFoundError) as e:
             messagebox.showerror("Error", f"Could not check file size: {e}")
-            return False
+            return None
 
     def get_upload_service_info(self, service: str) -> Optional[UploadService]:
         """
@@ -2456,72 +3399,38 @@ class ClipperGUI:
         """
         Return a list of SubtitleStream dataclass objects using ffprobe.
         """
-        try:
-            cmd = [
-                "ffprobe",
-                "-v",
-                "error",
-                "-select_streams",
-                "s",
-                "-show_entries",
-                "stream=index,codec_name:stream_tags=language,title",
-                "-of",
-                "json",
-                video_path,
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            data = json.loads(result.stdout)
-            streams = data.get("streams", [])
-            subtitle_streams = []
-            for i, s in enumerate(streams):
-                tags = s.get("tags", {})
-                subtitle_streams.append(
-                    SubtitleStream(
-                        index=s.get("index", i),
-                        map_index=i,
-                        codec_name=s.get("codec_name", ""),
-                        language=tags.get("language", "und"),
-                        title=tags.get("title", ""),
-                    )
+        streams = probed_streams(probe_media(video_path), "subtitle")
+        subtitle_streams = []
+        for i, s in enumerate(streams):
+            tags = s.get("tags", {})
+            subtitle_streams.append(
+                SubtitleStream(
+                    index=s.get("index", i),
+                    map_index=i,
+                    codec_name=s.get("codec_name", ""),
+                    language=tags.get("language", "und"),
+                    title=tags.get("title", ""),
                 )
-            return subtitle_streams
-        except Exception:
-            return []
+            )
+        return subtitle_streams
 
     def get_video_audio_streams(self, video_path) -> List[AudioStream]:
         """
         Return a list of AudioStream dataclass objects using ffprobe.
         """
-        try:
-            cmd = [
-                "ffprobe",
-                "-v",
-                "error",
-                "-select_streams",
-                "a",
-                "-show_entries",
-                "stream=index,codec_name:stream_tags=language,title",
-                "-of",
-                "json",
-                video_path,
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            data = json.loads(result.stdout)
-            streams = data.get("streams", [])
-            audio_streams = []
-            for s in streams:
-                tags = s.get("tags", {})
-                audio_streams.append(
-                    AudioStream(
-                        index=s.get("index", 0),
-                        codec_name=s.get("codec_name", ""),
-                        language=tags.get("language", "und"),
-                        title=tags.get("title", ""),
-                    )
+        streams = probed_streams(probe_media(video_path), "audio")
+        audio_streams = []
+        for s in streams:
+            tags = s.get("tags", {})
+            audio_streams.append(
+                AudioStream(
+                    index=s.get("index", 0),
+                    codec_name=s.get("codec_name", ""),
+                    language=tags.get("language", "und"),
+                    title=tags.get("title", ""),
                 )
-            return audio_streams
-        except Exception:
-            return []
+            )
+        return audio_streams
 
     def escape_subtitles_path(self, path):
         # For FFmpeg subtitles filter on Windows: use forward slashes and escape colons
@@ -2529,19 +3438,28 @@ class ClipperGUI:
         return path
 
 
-def main() -> None:
-    """Main entry point for the Clipper application."""
-    root = tk.Tk()
-    ClipperGUI(root)
-    root.update_idletasks()
-
+def _finalize_geometry(app: "ClipperGUI") -> None:
+    """Size, place and show the main window from inside the event loop."""
+    root = app.root
     min_width = WINDOW_MIN_WIDTH
-    min_height = root.winfo_height()
+    # setup_ui already flushed the layout, so the requested height is final
+    min_height = root.winfo_reqheight()
     root.minsize(min_width, min_height)
 
-    x = (root.winfo_screenwidth() // 2) - (min_width // 2)
-    y = (root.winfo_screenheight() // 3) - (min_height // 2)  # Start at 33% from top
+    # Center on the size being set: tk::PlaceWindow would use the requested
+    # width, which differs from WINDOW_MIN_WIDTH
+    x = max((app.screen_width - min_width) // 2, 0)
+    y = max((app.screen_height - min_height) // 2, 0)
     root.geometry(f"{min_width}x{min_height}+{x}+{y}")
+    root.deiconify()
+
+
+def main() -> None:
+    """Main entry point for the Clipper application."""
+    root = tk.Tk()
+    root.withdraw()  # Stay hidden until placed to avoid a visible jump
+    app = ClipperGUI(root)
+    root.after_idle(_finalize_geometry, app)
     root.mainloop()
 
 